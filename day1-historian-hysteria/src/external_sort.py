@@ -0,0 +1,235 @@
+"""
+Module for calculating distances between lists that do not fit in memory.
+"""
+import heapq
+import os
+import tempfile
+from array import array
+from itertools import islice
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# Default number of bytes the out-of-core mode may use for buffered numbers
+DEFAULT_MEMORY_BUDGET = 64 << 20
+
+# Default maximum number of run files merged at once for each column
+DEFAULT_MAX_FAN_IN = 128
+
+# Size in bytes of one stored number
+ITEM_SIZE = array('q').itemsize
+
+# Bytes used per number while sorting a run without NumPy: a list slot,
+# an int object and the sorted copy
+PYTHON_SORT_ITEM_SIZE = 48
+
+def write_sorted_run(buffer, length, directory, name):
+    """
+    Sort the first numbers of a buffer in place and write them to a run file.
+    
+    With NumPy available the numbers are sorted through a zero-copy view,
+    otherwise a temporary sorted list of them is built.
+    
+    Args:
+        buffer (array): Array of signed 64-bit integers
+        length (int): Number of values of the buffer in use
+        directory (str): Directory where the run file is created
+        name (str): Name of the run file
+        
+    Returns:
+        str: Path to the run file
+    """
+    if np is not None:
+        np.frombuffer(buffer, dtype=np.int64, count=length).sort()
+    else:
+        buffer[:length] = array('q', sorted(islice(buffer, length)))
+        
+    path = os.path.join(directory, name)
+    with open(path, 'wb') as file:
+        file.write(memoryview(buffer)[:length])
+    return path
+
+def spill_sorted_runs(chunks, run_size, directory):
+    """
+    Split both columns into sorted runs stored in temporary files.
+    
+    The buffers are allocated once with exactly run_size values, and chunks
+    are split across runs, so a large chunk never grows them.
+    
+    Args:
+        chunks (iterable): Pairs of arrays with the left and right numbers
+        run_size (int): Maximum number of values buffered per column
+        directory (str): Directory where the run files are created
+        
+    Returns:
+        tuple: Two lists containing the paths to the left and right runs
+    """
+    left_runs = []
+    right_runs = []
+    left_buffer = array('q', [0]) * run_size
+    right_buffer = array('q', [0]) * run_size
+    left_view = memoryview(left_buffer)
+    right_view = memoryview(right_buffer)
+    length = 0
+    
+    def flush():
+        index = len(left_runs)
+        left_runs.append(write_sorted_run(left_buffer, length, directory, f'left-{index}.run'))
+        right_runs.append(write_sorted_run(right_buffer, length, directory, f'right-{index}.run'))
+        
+    for left_chunk, right_chunk in chunks:
+        if len(left_chunk) != len(right_chunk):
+            raise ValueError("Lists must have the same length")
+        start = 0
+        while start < len(left_chunk):
+            count = min(run_size - length, len(left_chunk) - start)
+            # Copy through memory views to avoid temporary slices of the chunk
+            left_view[length:length + count] = memoryview(left_chunk)[start:start + count]
+            right_view[length:length + count] = memoryview(right_chunk)[start:start + count]
+            length += count
+            start += count
+            if length == run_size:
+                flush()
+                length = 0
+                
+    if length:
+        flush()
+        
+    return left_runs, right_runs
+
+def iter_run(path, block_size):
+    """
+    Read the numbers of a run file back block by block.
+    
+    Args:
+        path (str): Path to the run file
+        block_size (int): Number of values read at a time
+        
+    Yields:
+        int: Numbers of the run in sorted order
+    """
+    block = array('q', [0]) * block_size
+    with open(path, 'rb') as file:
+        while True:
+            # Read straight into the block, which is reused for the whole run
+            count = file.readinto(block) // ITEM_SIZE
+            if count == block_size:
+                yield from block
+            elif count:
+                yield from islice(block, count)
+            else:
+                break
+
+def merge_runs(paths, block_size):
+    """
+    Merge sorted run files into a single sorted stream.
+    
+    Args:
+        paths (list): Paths to the run files
+        block_size (int): Number of values buffered per run
+        
+    Returns:
+        iterator: Numbers of all runs in sorted order
+    """
+    return heapq.merge(*(iter_run(path, block_size) for path in paths))
+
+def merge_to_run(paths, block_size, path):
+    """
+    Merge sorted run files into a new run file, removing the merged ones.
+    
+    Args:
+        paths (list): Paths to the run files
+        block_size (int): Number of values buffered per run and for the output
+        path (str): Path to the merged run file
+        
+    Returns:
+        str: Path to the merged run file
+    """
+    block = array('q')
+    with open(path, 'wb') as file:
+        for num in merge_runs(paths, block_size):
+            block.append(num)
+            if len(block) == block_size:
+                block.tofile(file)
+                del block[:]
+        block.tofile(file)
+        
+    for merged in paths:
+        os.remove(merged)
+    return path
+
+def reduce_runs(paths, max_fan_in, capacity, prefix):
+    """
+    Merge run files in passes until at most max_fan_in of them are left.
+    
+    Each pass merges groups of max_fan_in runs, so no more than
+    max_fan_in + 1 files are open at once.
+    
+    Args:
+        paths (list): Paths to the run files
+        max_fan_in (int): Maximum number of runs merged at once
+        capacity (int): Number of values that may be buffered during a merge
+        prefix (str): Prefix of the merged run files, next to the first run
+        
+    Returns:
+        list: Paths to the remaining run files
+    """
+    passes = 0
+    while len(paths) > max_fan_in:
+        passes += 1
+        merged = []
+        for start in range(0, len(paths), max_fan_in):
+            group = paths[start:start + max_fan_in]
+            if len(group) == 1:
+                merged.extend(group)
+                continue
+            # Share the budget between the readers and the output block
+            block_size = max(1, capacity // (len(group) + 1))
+            path = os.path.join(os.path.dirname(group[0]), f'{prefix}-{passes}-{len(merged)}.run')
+            merged.append(merge_to_run(group, block_size, path))
+        paths = merged
+    return paths
+
+def calculate_total_distance_external(chunks, memory_budget=DEFAULT_MEMORY_BUDGET, temp_dir=None,
+                                      max_fan_in=DEFAULT_MAX_FAN_IN):
+    """
+    Calculate the total distance between two lists using an external merge sort.
+    
+    Gives the same result as calculate_total_distance, but only keeps about
+    memory_budget bytes of numbers in memory at once. Sorted runs of each
+    column are spilled to temporary files and merged in passes of at most
+    max_fan_in runs, then both columns are merged in lockstep to stream the
+    distances, with at most 2 * max_fan_in files open.
+    
+    Args:
+        chunks (iterable): Pairs of arrays with the left and right numbers,
+            as produced by input_parser.iter_input_chunks
+        memory_budget (int): Number of bytes available for buffered numbers
+        temp_dir (str): Directory for the run files, defaults to the system one
+        max_fan_in (int): Maximum number of runs merged at once per column
+        
+    Returns:
+        int: Total distance between paired numbers
+    """
+    if max_fan_in < 2:
+        raise ValueError("At least two runs must be merged at once")
+        
+    # Both columns are buffered side by side while spilling, and sorting
+    # without NumPy needs extra memory for the run being sorted
+    pair_size = 2 * ITEM_SIZE + (PYTHON_SORT_ITEM_SIZE if np is None else 0)
+    run_size = max(1, memory_budget // pair_size)
+    capacity = max(1, memory_budget // ITEM_SIZE)
+    
+    with tempfile.TemporaryDirectory(dir=temp_dir) as directory:
+        left_runs, right_runs = spill_sorted_runs(chunks, run_size, directory)
+        left_runs = reduce_runs(left_runs, max_fan_in, capacity, 'left')
+        right_runs = reduce_runs(right_runs, max_fan_in, capacity, 'right')
+        
+        # Share the budget between the readers of every run
+        block_size = max(1, capacity // max(1, len(left_runs) + len(right_runs)))
+        sorted_left = merge_runs(left_runs, block_size)
+        sorted_right = merge_runs(right_runs, block_size)
+        
+        return sum(abs(left - right) for left, right in zip(sorted_left, sorted_right))
@@ -1,6 +1,10 @@
 """
 Module for parsing input data from files.
 """
+from array import array
+
+# Number of bytes read at a time by the bulk parser
+DEFAULT_CHUNK_SIZE = 1 << 20
 
 def parse_input(file_path):
     """
@@ -27,3 +31,75 @@ def parse_input(file_path):
         return [], []
         
     return left_list, right_list
+
+def _parse_chunk(data):
+    """
+    Parse a block of complete lines into two compact integer arrays.
+    
+    Args:
+        data (bytes): Block of input lines, each holding two numbers
+        
+    Returns:
+        tuple: Two arrays of signed 64-bit integers for the left and right numbers
+    """
+    tokens = data.split()
+    if len(tokens) % 2:
+        raise ValueError("Each line must contain exactly two numbers")
+        
+    return array('q', map(int, tokens[0::2])), array('q', map(int, tokens[1::2]))
+
+def iter_input_chunks(file_path, chunk_size=DEFAULT_CHUNK_SIZE):
+    """
+    Read the input file in large chunks of complete lines.
+    
+    Args:
+        file_path (str): Path to the input file
+        chunk_size (int): Number of bytes to read at a time
+        
+    Yields:
+        tuple: Two arrays of signed 64-bit integers for the left and right numbers
+    """
+    remainder = b''
+    
+    with open(file_path, 'rb') as file:
+        while True:
+            chunk = file.read(chunk_size)
+            if not chunk:
+                break
+            chunk = remainder + chunk
+            
+            # Only parse up to the last complete line, keep the rest for later
+            cut = chunk.rfind(b'\n') + 1
+            remainder = chunk[cut:]
+            if cut:
+                yield _parse_chunk(chunk[:cut])
+                
+    if remainder.strip():
+        yield _parse_chunk(remainder)
+
+def parse_input_buffers(file_path, chunk_size=DEFAULT_CHUNK_SIZE):
+    """
+    Parse the input file into two compact integer buffers.
+    
+    Unlike parse_input, the numbers are stored unboxed as signed 64-bit
+    integers, so both columns take about 16 bytes per line in total.
+    
+    Args:
+        file_path (str): Path to the input file
+        chunk_size (int): Number of bytes to read at a time
+        
+    Returns:
+        tuple: Two arrays containing the left and right numbers
+    """
+    left_buffer = array('q')
+    right_buffer = array('q')
+    
+    try:
+        for left_chunk, right_chunk in iter_input_chunks(file_path, chunk_size):
+            left_buffer.extend(left_chunk)
+            right_buffer.extend(right_chunk)
+    except FileNotFoundError:
+        print(f"Error: Input file '{file_path}' not found.")
+        return array('q'), array('q')
+        
+    return left_buffer, right_buffer
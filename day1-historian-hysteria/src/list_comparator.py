@@ -1,6 +1,28 @@
 """
 Module for comparing lists and calculating distances and similarities between them.
 """
+import bisect
+from array import array
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# Number of values processed at a time by the vectorized buffer paths
+BLOCK_SIZE = 1 << 16
+
+# Backends available for calculate_similarity_score
+SIMILARITY_BACKENDS = ('auto', 'python', 'unique', 'bincount')
+
+# Inputs with fewer numbers than this are scored in pure Python
+MIN_ARRAY_SIZE = 1 << 12
+
+# The bincount engine is used when the ID range is at most this many times the list size
+DENSE_RANGE_FACTOR = 4
+
+# Largest value of a signed 64-bit integer, sums above it are done in Python
+INT64_MAX = (1 << 63) - 1
 
 def calculate_total_distance(left_list, right_list):
     """
@@ -29,7 +51,7 @@ def calculate_total_distance(left_list, right_list):
         
     return total_distance
 
-def calculate_similarity_score(left_list, right_list):
+def calculate_similarity_score(left_list, right_list, backend='auto'):
     """
     Calculate the similarity score between two lists.
     The score is calculated by multiplying each number in the left list
@@ -38,10 +60,26 @@ def calculate_similarity_score(left_list, right_list):
     Args:
         left_list (list): First list of numbers
         right_list (list): Second list of numbers
+        backend (str): One of 'auto', 'python', 'unique' or 'bincount'.
+            'auto' uses NumPy for large inputs when it is installed
+            and falls back to pure Python otherwise.
         
     Returns:
         int: Total similarity score
     """
+    if backend not in SIMILARITY_BACKENDS:
+        raise ValueError(f"Unknown similarity backend '{backend}'")
+        
+    if backend == 'auto' and np is not None:
+        if len(left_list) + len(right_list) >= MIN_ARRAY_SIZE:
+            try:
+                return calculate_similarity_score_array(left_list, right_list)
+            except OverflowError:
+                # Numbers beyond 64 bits are only supported in pure Python
+                pass
+    elif backend in ('unique', 'bincount'):
+        return calculate_similarity_score_array(left_list, right_list, backend)
+        
     # Create a frequency map for the right list
     right_frequencies = {}
     for num in right_list:
@@ -56,3 +94,292 @@ def calculate_similarity_score(left_list, right_list):
         total_score += num * frequency
     
     return total_score
+
+def calculate_similarity_score_array(left_list, right_list, engine='auto'):
+    """
+    Calculate the similarity score between two lists with NumPy.
+    
+    The 'bincount' engine counts the right list into a dense table indexed by
+    value, the 'unique' engine looks frequencies up with a binary search over
+    the distinct values of the right list. With 'auto', bincount is chosen
+    when the range of the right list is small compared to its size.
+    
+    Args:
+        left_list (list): First list of numbers
+        right_list (list): Second list of numbers
+        engine (str): One of 'auto', 'unique' or 'bincount'
+        
+    Returns:
+        int: Total similarity score
+    """
+    if np is None:
+        raise ImportError("NumPy is required for the array similarity backend")
+        
+    left = np.asarray(left_list, dtype=np.int64)
+    right = np.asarray(right_list, dtype=np.int64)
+    
+    if not len(left) or not len(right):
+        return 0
+        
+    low = int(right.min())
+    high = int(right.max())
+    
+    if engine == 'auto':
+        dense = high - low + 1 <= DENSE_RANGE_FACTOR * len(right)
+        engine = 'bincount' if dense else 'unique'
+        
+    if engine == 'bincount':
+        frequencies = np.bincount(right - low)
+        matched = left[(left >= low) & (left <= high)]
+        return _sum_products(matched, frequencies[matched - low])
+        
+    values, frequencies = np.unique(right, return_counts=True)
+    indices = np.minimum(np.searchsorted(values, left), len(values) - 1)
+    found = values[indices] == left
+    return _sum_products(left[found], frequencies[indices[found]])
+
+def _max_abs(values):
+    """
+    Return the largest absolute value of a non-empty array as a Python int.
+    """
+    return max(abs(int(values.min())), abs(int(values.max())))
+
+def _sum_products(values, frequencies):
+    """
+    Sum the products of two arrays without overflowing 64-bit integers.
+    
+    Blocks are summed with NumPy when no block sum can exceed the int64
+    range, otherwise the products are summed as Python ints.
+    
+    Args:
+        values (ndarray): Array of signed 64-bit integers
+        frequencies (ndarray): Array of non-negative counts, same length
+        
+    Returns:
+        int: Sum of the products
+    """
+    if not len(values):
+        return 0
+        
+    bound = _max_abs(values) * int(frequencies.max()) * min(len(values), BLOCK_SIZE)
+    if bound > INT64_MAX:
+        return sum(value * frequency
+                   for value, frequency in zip(values.tolist(), frequencies.tolist()))
+        
+    total = 0
+    for start in range(0, len(values), BLOCK_SIZE):
+        stop = start + BLOCK_SIZE
+        total += int((values[start:stop] * frequencies[start:stop]).sum())
+    return total
+
+def sort_in_place(buffer):
+    """
+    Sort a buffer of signed 64-bit integers in place.
+    
+    With NumPy available the buffer is sorted through a zero-copy view,
+    otherwise a temporary sorted list is written back into it.
+    
+    Args:
+        buffer (array): Array of signed 64-bit integers
+    """
+    if np is not None:
+        np.frombuffer(buffer, dtype=np.int64).sort()
+    else:
+        buffer[:] = array('q', sorted(buffer))
+
+def calculate_total_distance_in_place(left_buffer, right_buffer):
+    """
+    Calculate the total distance between two buffers without copying them.
+    
+    Both buffers are sorted in place, so they can be passed on to
+    calculate_similarity_score_sorted afterwards.
+    
+    Args:
+        left_buffer (array): First buffer of signed 64-bit integers
+        right_buffer (array): Second buffer of signed 64-bit integers
+        
+    Returns:
+        int: Total distance between paired numbers
+    """
+    if len(left_buffer) != len(right_buffer):
+        raise ValueError("Lists must have the same length")
+        
+    sort_in_place(left_buffer)
+    sort_in_place(right_buffer)
+    
+    if np is None:
+        return sum(abs(left - right) for left, right in zip(left_buffer, right_buffer))
+        
+    left_view = np.frombuffer(left_buffer, dtype=np.int64)
+    right_view = np.frombuffer(right_buffer, dtype=np.int64)
+    if not len(left_view):
+        return 0
+        
+    # Differences and block sums must stay within the int64 range
+    low = min(int(left_view[0]), int(right_view[0]))
+    high = max(int(left_view[-1]), int(right_view[-1]))
+    if (high - low) * min(len(left_view), BLOCK_SIZE) > INT64_MAX:
+        return sum(abs(left - right) for left, right in zip(left_buffer, right_buffer))
+        
+    total_distance = 0
+    
+    # Work block by block so temporaries stay small
+    for start in range(0, len(left_view), BLOCK_SIZE):
+        stop = start + BLOCK_SIZE
+        distances = np.abs(left_view[start:stop] - right_view[start:stop])
+        total_distance += int(distances.sum())
+        
+    return total_distance
+
+def calculate_similarity_score_sorted(left_buffer, right_buffer):
+    """
+    Calculate the similarity score between two sorted buffers.
+    
+    The buffers are walked side by side, so no frequency map is needed.
+    
+    Args:
+        left_buffer (array): First sorted buffer of signed 64-bit integers
+        right_buffer (array): Second sorted buffer of signed 64-bit integers
+        
+    Returns:
+        int: Total similarity score
+    """
+    if np is not None:
+        left_view = np.frombuffer(left_buffer, dtype=np.int64)
+        right_view = np.frombuffer(right_buffer, dtype=np.int64)
+        total_score = 0
+        
+        for start in range(0, len(left_view), BLOCK_SIZE):
+            block = left_view[start:start + BLOCK_SIZE]
+            frequencies = (np.searchsorted(right_view, block, side='right')
+                           - np.searchsorted(right_view, block, side='left'))
+            total_score += _sum_products(block, frequencies)
+            
+        return total_score
+        
+    total_score = 0
+    right_index = 0
+    right_length = len(right_buffer)
+    current = None
+    frequency = 0
+    
+    for num in left_buffer:
+        if num != current:
+            # Skip smaller numbers, then count the run of equal ones
+            while right_index < right_length and right_buffer[right_index] < num:
+                right_index += 1
+            frequency = 0
+            while (right_index + frequency < right_length
+                   and right_buffer[right_index + frequency] == num):
+                frequency += 1
+            current = num
+        total_score += num * frequency
+        
+    return total_score
+
+class ListComparator:
+    """
+    Keep the total distance and similarity score of two lists up to date
+    while pairs of numbers are added or removed.
+    
+    Both lists are kept sorted, so an update only re-pairs the numbers
+    ranked between the positions of the new left and right numbers
+    instead of re-sorting everything. The similarity score is updated in
+    constant time from the frequency maps of both lists.
+    """
+    
+    def __init__(self, left_list=(), right_list=()):
+        """
+        Initialize the comparator with two lists of numbers.
+        
+        Args:
+            left_list (list): First list of numbers
+            right_list (list): Second list of numbers
+        """
+        if len(left_list) != len(right_list):
+            raise ValueError("Lists must have the same length")
+            
+        self.sorted_left = sorted(left_list)
+        self.sorted_right = sorted(right_list)
+        self.left_frequencies = {}
+        self.right_frequencies = {}
+        self.total_distance = calculate_total_distance(self.sorted_left, self.sorted_right)
+        self.similarity_score = 0
+        
+        for num in self.sorted_left:
+            self.left_frequencies[num] = self.left_frequencies.get(num, 0) + 1
+        for num in self.sorted_right:
+            self.right_frequencies[num] = self.right_frequencies.get(num, 0) + 1
+        for num, frequency in self.left_frequencies.items():
+            self.similarity_score += num * frequency * self.right_frequencies.get(num, 0)
+            
+    def __len__(self):
+        return len(self.sorted_left)
+        
+    def _window_distance(self, start, stop):
+        """
+        Sum the distances of the pairs ranked from start to stop (exclusive).
+        """
+        total_distance = 0
+        for rank in range(start, stop):
+            total_distance += abs(self.sorted_left[rank] - self.sorted_right[rank])
+        return total_distance
+        
+    def add(self, left, right):
+        """
+        Add a pair of numbers to the lists.
+        
+        Args:
+            left (int): Number appended to the left list
+            right (int): Number appended to the right list
+        """
+        left_rank = bisect.bisect_right(self.sorted_left, left)
+        right_rank = bisect.bisect_right(self.sorted_right, right)
+        start, stop = min(left_rank, right_rank), max(left_rank, right_rank)
+        
+        # Pairs outside the two insertion points keep the same partners
+        self.total_distance -= self._window_distance(start, stop)
+        self.sorted_left.insert(left_rank, left)
+        self.sorted_right.insert(right_rank, right)
+        self.total_distance += self._window_distance(start, stop + 1)
+        
+        self.similarity_score += left * self.right_frequencies.get(left, 0)
+        self.left_frequencies[left] = self.left_frequencies.get(left, 0) + 1
+        self.similarity_score += right * self.left_frequencies.get(right, 0)
+        self.right_frequencies[right] = self.right_frequencies.get(right, 0) + 1
+        
+    def remove(self, left, right):
+        """
+        Remove a pair of numbers from the lists.
+        
+        Args:
+            left (int): Number removed from the left list
+            right (int): Number removed from the right list
+        """
+        left_rank = bisect.bisect_left(self.sorted_left, left)
+        right_rank = bisect.bisect_left(self.sorted_right, right)
+        if left not in self.left_frequencies:
+            raise ValueError(f"{left} is not in the left list")
+        if right not in self.right_frequencies:
+            raise ValueError(f"{right} is not in the right list")
+        start, stop = min(left_rank, right_rank), max(left_rank, right_rank)
+        
+        self.total_distance -= self._window_distance(start, stop + 1)
+        del self.sorted_left[left_rank]
+        del self.sorted_right[right_rank]
+        self.total_distance += self._window_distance(start, stop)
+        
+        self._decrement(self.right_frequencies, right)
+        self.similarity_score -= right * self.left_frequencies.get(right, 0)
+        self._decrement(self.left_frequencies, left)
+        self.similarity_score -= left * self.right_frequencies.get(left, 0)
+        
+    @staticmethod
+    def _decrement(frequencies, num):
+        """
+        Decrease the frequency of a number, dropping it once it reaches zero.
+        """
+        if frequencies[num] == 1:
+            del frequencies[num]
+        else:
+            frequencies[num] -= 1
@@ -1,8 +1,8 @@
 """
 Main application for solving the Historian Hysteria challenge.
 """
-from input_parser import parse_input
-from list_comparator import calculate_total_distance, calculate_similarity_score
+from input_parser import parse_input_buffers
+from list_comparator import calculate_total_distance_in_place, calculate_similarity_score_sorted
 
 def solve_challenge():
     """
@@ -11,17 +11,17 @@ def solve_challenge():
     print("Day 1: Historian Hysteria")
     print("-------------------------")
     
-    # Parse input file
-    left_list, right_list = parse_input('./input.txt')
+    # Parse input file into compact buffers
+    left_buffer, right_buffer = parse_input_buffers('./input.txt')
     
-    if not left_list or not right_list:
+    if not left_buffer or not right_buffer:
         return
     
-    # Part 1: Calculate total distance
-    total_distance = calculate_total_distance(left_list, right_list)
+    # Part 1: Calculate total distance (sorts both buffers in place)
+    total_distance = calculate_total_distance_in_place(left_buffer, right_buffer)
     
-    # Part 2: Calculate similarity score
-    similarity_score = calculate_similarity_score(left_list, right_list)
+    # Part 2: Calculate similarity score on the sorted buffers
+    similarity_score = calculate_similarity_score_sorted(left_buffer, right_buffer)
     
     print(f"\nResults:")
     print(f"Part 1 - Total distance between the lists: {total_distance}")
@@ -0,0 +1,136 @@
+"""
+Module for calculating the similarity score of large input files on several cores.
+"""
+import os
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+
+# Number of bytes read at a time by each worker
+SHARD_CHUNK_SIZE = 1 << 20
+
+def find_shard_offsets(file_path, shards):
+    """
+    Split the input file into byte ranges that start at the beginning of a line.
+    
+    Args:
+        file_path (str): Path to the input file
+        shards (int): Number of byte ranges wanted
+        
+    Returns:
+        list: Sorted offsets, each shard spans two consecutive offsets
+    """
+    size = os.path.getsize(file_path)
+    offsets = [0]
+    
+    with open(file_path, 'rb') as file:
+        for shard in range(1, shards):
+            # Move to the start of the first line beginning at or after the cut
+            file.seek(max(size * shard // shards - 1, 0))
+            file.readline()
+            offset = file.tell()
+            if offsets[-1] < offset < size:
+                offsets.append(offset)
+                
+    offsets.append(size)
+    return offsets
+
+def count_shard(file_path, start, end):
+    """
+    Build the frequency maps of both columns for one byte range of the input file.
+    
+    Args:
+        file_path (str): Path to the input file
+        start (int): Offset of the first byte of the shard
+        end (int): Offset just past the last byte of the shard
+        
+    Returns:
+        tuple: Two counters with the left and right number frequencies
+    """
+    left_frequencies = Counter()
+    right_frequencies = Counter()
+    remainder = b''
+    
+    with open(file_path, 'rb') as file:
+        file.seek(start)
+        position = start
+        while position < end:
+            chunk = file.read(min(SHARD_CHUNK_SIZE, end - position))
+            if not chunk:
+                break
+            position += len(chunk)
+            chunk = remainder + chunk
+            
+            # Only split up to the last complete line, keep the rest for later
+            cut = chunk.rfind(b'\n') + 1 if position < end else len(chunk)
+            remainder = chunk[cut:]
+            tokens = chunk[:cut].split()
+            if len(tokens) % 2:
+                raise ValueError("Each line must contain exactly two numbers")
+            left_frequencies.update(map(int, tokens[0::2]))
+            right_frequencies.update(map(int, tokens[1::2]))
+            
+    return left_frequencies, right_frequencies
+
+def merge_frequencies(partials):
+    """
+    Merge the partial frequency maps produced by count_shard.
+    
+    Args:
+        partials (iterable): Pairs of left and right counters
+        
+    Returns:
+        tuple: Two counters with the merged left and right frequencies
+    """
+    left_frequencies = Counter()
+    right_frequencies = Counter()
+    
+    for left_partial, right_partial in partials:
+        left_frequencies.update(left_partial)
+        right_frequencies.update(right_partial)
+        
+    return left_frequencies, right_frequencies
+
+def similarity_from_frequencies(left_frequencies, right_frequencies):
+    """
+    Calculate the similarity score as the dot product of two frequency maps.
+    
+    Args:
+        left_frequencies (dict): Frequency of each number in the left list
+        right_frequencies (dict): Frequency of each number in the right list
+        
+    Returns:
+        int: Total similarity score
+    """
+    # Iterate over the smaller map and look numbers up in the larger one
+    if len(left_frequencies) > len(right_frequencies):
+        left_frequencies, right_frequencies = right_frequencies, left_frequencies
+        
+    return sum(
+        num * frequency * right_frequencies.get(num, 0)
+        for num, frequency in left_frequencies.items()
+    )
+
+def calculate_similarity_score_parallel(file_path, workers=None):
+    """
+    Calculate the similarity score of an input file using a pool of processes.
+    
+    The file is split by byte offset into one shard per worker. Each worker
+    counts the numbers of both columns in its shard, and the partial counts
+    are merged before taking their dot product.
+    
+    Args:
+        file_path (str): Path to the input file
+        workers (int): Number of worker processes, defaults to the CPU count
+        
+    Returns:
+        int: Total similarity score
+    """
+    workers = workers or os.cpu_count() or 1
+    offsets = find_shard_offsets(file_path, workers)
+    
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        partials = executor.map(count_shard, repeat(file_path), offsets[:-1], offsets[1:])
+        left_frequencies, right_frequencies = merge_frequencies(partials)
+        
+    return similarity_from_frequencies(left_frequencies, right_frequencies)
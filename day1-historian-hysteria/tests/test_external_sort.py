@@ -0,0 +1,73 @@
+"""
+Test cases for external sort module.
+python -m unittest discover -s tests -v
+"""
+import random
+import unittest
+from array import array
+from unittest import mock
+from src import external_sort
+from src.external_sort import calculate_total_distance_external
+from src.list_comparator import calculate_total_distance
+
+def make_chunks(left_list, right_list, chunk_length):
+    """Split two lists into pairs of arrays like the bulk parser does."""
+    return [
+        (array('q', left_list[i:i + chunk_length]), array('q', right_list[i:i + chunk_length]))
+        for i in range(0, len(left_list), chunk_length)
+    ]
+
+class TestExternalSort(unittest.TestCase):
+    """Test cases for the out-of-core distance calculation."""
+    
+    def test_example(self):
+        """Test distance calculation with example from problem description."""
+        chunks = make_chunks([3, 4, 2, 1, 3, 3], [4, 3, 5, 3, 9, 3], 2)
+        self.assertEqual(calculate_total_distance_external(chunks, memory_budget=32), 11)
+        
+    def test_empty_input(self):
+        """Test with no chunks at all."""
+        self.assertEqual(calculate_total_distance_external([]), 0)
+        
+    def test_unequal_chunks(self):
+        """Test with chunks of different lengths."""
+        with self.assertRaises(ValueError):
+            calculate_total_distance_external([(array('q', [1, 2]), array('q', [1]))])
+            
+    def test_matches_in_memory_result(self):
+        """Test many small runs give the same result as the in-memory sort."""
+        rng = random.Random(2024)
+        left_list = [rng.randrange(-10**6, 10**6) for _ in range(5000)]
+        right_list = [rng.randrange(-10**6, 10**6) for _ in range(5000)]
+        chunks = make_chunks(left_list, right_list, 97)
+        
+        self.assertEqual(
+            calculate_total_distance_external(chunks, memory_budget=4096),
+            calculate_total_distance(left_list, right_list),
+        )
+        
+    def test_multi_pass_merge(self):
+        """Test merging in several passes when there are more runs than the fan-in."""
+        rng = random.Random(2024)
+        left_list = [rng.randrange(-10**6, 10**6) for _ in range(3000)]
+        right_list = [rng.randrange(-10**6, 10**6) for _ in range(3000)]
+        expected = calculate_total_distance(left_list, right_list)
+        
+        for max_fan_in in (2, 3, 16):
+            with self.subTest(max_fan_in=max_fan_in):
+                chunks = make_chunks(left_list, right_list, 1000)
+                self.assertEqual(
+                    calculate_total_distance_external(chunks, memory_budget=512, max_fan_in=max_fan_in),
+                    expected,
+                )
+                
+    def test_invalid_fan_in(self):
+        """Test with a fan-in too small to merge anything."""
+        with self.assertRaises(ValueError):
+            calculate_total_distance_external([], max_fan_in=1)
+            
+    def test_pure_python_fallback(self):
+        """Test the runs are sorted the same way without NumPy."""
+        chunks = make_chunks([3, 4, 2, 1, 3, 3], [4, 3, 5, 3, 9, 3], 4)
+        with mock.patch.object(external_sort, 'np', None):
+            self.assertEqual(calculate_total_distance_external(chunks, memory_budget=128), 11)
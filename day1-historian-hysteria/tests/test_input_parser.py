@@ -0,0 +1,41 @@
+"""
+Test cases for input parser module.
+python -m unittest discover -s tests -v
+"""
+import os
+import tempfile
+import unittest
+from src.input_parser import parse_input, parse_input_buffers
+
+class TestInputParser(unittest.TestCase):
+    """Test cases for input parsing functionality."""
+    
+    def setUp(self):
+        """Write the example from the problem description to a file."""
+        handle, self.file_path = tempfile.mkstemp()
+        with os.fdopen(handle, 'w') as file:
+            file.write("3   4\n4   3\n2   5\n1   3\n3   9\n3   3")
+            
+    def tearDown(self):
+        """Remove the example file."""
+        os.remove(self.file_path)
+        
+    def test_parse_input_buffers(self):
+        """Test the bulk parser matches the line-by-line parser."""
+        left_buffer, right_buffer = parse_input_buffers(self.file_path)
+        left_list, right_list = parse_input(self.file_path)
+        
+        self.assertEqual(left_buffer.typecode, 'q')
+        self.assertEqual(list(left_buffer), left_list)
+        self.assertEqual(list(right_buffer), right_list)
+        
+    def test_small_chunks(self):
+        """Test lines split across chunk boundaries are parsed correctly."""
+        left_buffer, right_buffer = parse_input_buffers(self.file_path, chunk_size=5)
+        self.assertEqual(list(left_buffer), [3, 4, 2, 1, 3, 3])
+        self.assertEqual(list(right_buffer), [4, 3, 5, 3, 9, 3])
+        
+    def test_missing_file(self):
+        """Test with a missing input file."""
+        left_buffer, right_buffer = parse_input_buffers(self.file_path + '.missing')
+        self.assertEqual((len(left_buffer), len(right_buffer)), (0, 0))
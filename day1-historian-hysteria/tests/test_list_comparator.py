@@ -2,8 +2,19 @@
 Test cases for list comparator module.
 python -m unittest discover -s tests -v
 """
+import random
 import unittest
-from src.list_comparator import calculate_total_distance, calculate_similarity_score
+from array import array
+from unittest import mock
+from src import list_comparator
+from src.list_comparator import (
+    calculate_total_distance,
+    calculate_similarity_score,
+    calculate_total_distance_in_place,
+    calculate_similarity_score_sorted,
+    calculate_similarity_score_array,
+    ListComparator,
+)
 
 class TestListComparator(unittest.TestCase):
     """Test cases for list comparison functionality."""
@@ -65,3 +76,137 @@ class TestListComparator(unittest.TestCase):
         # 2 appears twice (2 * 2 = 4)
         # Total: 1 + 4 + 4 = 9
         self.assertEqual(calculate_similarity_score(left_list, right_list), 9)
+
+
+class TestBufferComparator(unittest.TestCase):
+    """Test cases for the in-place buffer comparison path."""
+    
+    def test_total_distance_in_place(self):
+        """Test distance calculation sorts the buffers in place."""
+        left_buffer = array('q', [3, 4, 2, 1, 3, 3])
+        right_buffer = array('q', [4, 3, 5, 3, 9, 3])
+        
+        self.assertEqual(calculate_total_distance_in_place(left_buffer, right_buffer), 11)
+        self.assertEqual(list(left_buffer), [1, 2, 3, 3, 3, 4])
+        self.assertEqual(list(right_buffer), [3, 3, 3, 4, 5, 9])
+        
+    def test_similarity_score_sorted(self):
+        """Test similarity score on sorted buffers."""
+        left_buffer = array('q', [1, 2, 3, 3, 3, 4])
+        right_buffer = array('q', [3, 3, 3, 4, 5, 9])
+        self.assertEqual(calculate_similarity_score_sorted(left_buffer, right_buffer), 31)
+        
+    def test_unequal_buffers(self):
+        """Test with buffers of different lengths."""
+        with self.assertRaises(ValueError):
+            calculate_total_distance_in_place(array('q', [1, 2]), array('q', [1]))
+            
+    def test_pure_python_fallback(self):
+        """Test the buffer path gives the same results without NumPy."""
+        with mock.patch.object(list_comparator, 'np', None):
+            left_buffer = array('q', [3, 4, 2, 1, 3, 3])
+            right_buffer = array('q', [4, 3, 5, 3, 9, 3])
+            self.assertEqual(calculate_total_distance_in_place(left_buffer, right_buffer), 11)
+            self.assertEqual(calculate_similarity_score_sorted(left_buffer, right_buffer), 31)
+
+
+@unittest.skipIf(list_comparator.np is None, "NumPy is not installed")
+class TestArraySimilarity(unittest.TestCase):
+    """Test cases for the NumPy similarity backend."""
+    
+    def test_engines_match_example(self):
+        """Test every engine with example from problem description."""
+        left_list = [3, 4, 2, 1, 3, 3]
+        right_list = [4, 3, 5, 3, 9, 3]
+        for backend in ('python', 'unique', 'bincount'):
+            with self.subTest(backend=backend):
+                self.assertEqual(calculate_similarity_score(left_list, right_list, backend), 31)
+                
+    def test_engines_match_python(self):
+        """Test dense and sparse inputs against the pure-Python path."""
+        rng = random.Random(2024)
+        for spread, engines in ((50, ('auto', 'unique', 'bincount')), (10**9, ('auto', 'unique'))):
+            left_list = [rng.randrange(-spread, spread) for _ in range(5000)]
+            right_list = [rng.randrange(-spread, spread) for _ in range(5000)]
+            expected = calculate_similarity_score(left_list, right_list, 'python')
+            for engine in engines:
+                with self.subTest(spread=spread, engine=engine):
+                    self.assertEqual(
+                        calculate_similarity_score_array(left_list, right_list, engine),
+                        expected,
+                    )
+            self.assertEqual(calculate_similarity_score(left_list, right_list), expected)
+            
+    def test_large_values_do_not_overflow(self):
+        """Test sums beyond the int64 range match the pure-Python path."""
+        numbers = [3_000_000_000] * 70000
+        expected = calculate_similarity_score(numbers, numbers, 'python')
+        for backend in ('auto', 'unique', 'bincount'):
+            with self.subTest(backend=backend):
+                self.assertEqual(calculate_similarity_score(numbers, numbers, backend), expected)
+                
+        buffer = array('q', numbers)
+        self.assertEqual(calculate_similarity_score_sorted(buffer, buffer), expected)
+        
+        left_buffer = array('q', [-(1 << 63)] * 5)
+        right_buffer = array('q', [(1 << 63) - 1] * 5)
+        self.assertEqual(calculate_total_distance_in_place(left_buffer, right_buffer),
+                         5 * ((1 << 64) - 1))
+                         
+    def test_numbers_beyond_64_bits(self):
+        """Test the auto backend falls back to pure Python for huge numbers."""
+        size = list_comparator.MIN_ARRAY_SIZE
+        numbers = [1 << 70] * size
+        self.assertEqual(calculate_similarity_score(numbers, numbers), size * size * (1 << 70))
+                         
+    def test_empty_lists(self):
+        """Test with empty lists."""
+        self.assertEqual(calculate_similarity_score_array([], [1, 2]), 0)
+        self.assertEqual(calculate_similarity_score_array([1, 2], []), 0)
+        
+    def test_unknown_backend(self):
+        """Test with an unknown backend name."""
+        with self.assertRaises(ValueError):
+            calculate_similarity_score([1], [1], 'gpu')
+
+
+class TestIncrementalComparator(unittest.TestCase):
+    """Test cases for the incremental list comparator."""
+    
+    def test_example(self):
+        """Test adding the example from problem description pair by pair."""
+        comparator = ListComparator()
+        for left, right in zip([3, 4, 2, 1, 3, 3], [4, 3, 5, 3, 9, 3]):
+            comparator.add(left, right)
+            
+        self.assertEqual(len(comparator), 6)
+        self.assertEqual(comparator.total_distance, 11)
+        self.assertEqual(comparator.similarity_score, 31)
+        
+    def test_remove_missing_number(self):
+        """Test removing a number that is not in the lists."""
+        comparator = ListComparator([1, 2], [3, 4])
+        with self.assertRaises(ValueError):
+            comparator.remove(5, 3)
+        self.assertEqual(comparator.total_distance, 4)
+        
+    def test_random_updates(self):
+        """Test random additions and removals against a full recomputation."""
+        rng = random.Random(2024)
+        left_list = [rng.randrange(20) for _ in range(50)]
+        right_list = [rng.randrange(20) for _ in range(50)]
+        comparator = ListComparator(left_list, right_list)
+        
+        for _ in range(500):
+            if left_list and rng.random() < 0.4:
+                left = left_list.pop(rng.randrange(len(left_list)))
+                right = right_list.pop(rng.randrange(len(right_list)))
+                comparator.remove(left, right)
+            else:
+                left, right = rng.randrange(20), rng.randrange(20)
+                left_list.append(left)
+                right_list.append(right)
+                comparator.add(left, right)
+                
+            self.assertEqual(comparator.total_distance, calculate_total_distance(left_list, right_list))
+            self.assertEqual(comparator.similarity_score, calculate_similarity_score(left_list, right_list))
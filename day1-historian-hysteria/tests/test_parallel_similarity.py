@@ -0,0 +1,67 @@
+"""
+Test cases for parallel similarity module.
+python -m unittest discover -s tests -v
+"""
+import os
+import random
+import tempfile
+import unittest
+from unittest import mock
+from src import parallel_similarity
+from src.parallel_similarity import (
+    calculate_similarity_score_parallel,
+    count_shard,
+    find_shard_offsets,
+    merge_frequencies,
+    similarity_from_frequencies,
+)
+from src.list_comparator import calculate_similarity_score
+
+class TestParallelSimilarity(unittest.TestCase):
+    """Test cases for sharded similarity scoring."""
+    
+    def setUp(self):
+        """Write random pairs of numbers to an input file."""
+        rng = random.Random(2024)
+        self.left_list = [rng.randrange(100) for _ in range(2000)]
+        self.right_list = [rng.randrange(100) for _ in range(2000)]
+        handle, self.file_path = tempfile.mkstemp()
+        with os.fdopen(handle, 'w') as file:
+            for left, right in zip(self.left_list, self.right_list):
+                file.write(f"{left}   {right}\n")
+                
+    def tearDown(self):
+        """Remove the input file."""
+        os.remove(self.file_path)
+        
+    def test_shards_cover_whole_lines(self):
+        """Test the shards partition the file along line boundaries."""
+        offsets = find_shard_offsets(self.file_path, 7)
+        self.assertEqual(offsets[0], 0)
+        self.assertEqual(offsets[-1], os.path.getsize(self.file_path))
+        
+        with open(self.file_path, 'rb') as file:
+            content = file.read()
+        for offset in offsets[1:-1]:
+            self.assertEqual(content[offset - 1:offset], b'\n')
+            
+    def test_merged_shards_match_single_pass(self):
+        """Test the merged shard counts give the same score as the list path."""
+        offsets = find_shard_offsets(self.file_path, 5)
+        with mock.patch.object(parallel_similarity, 'SHARD_CHUNK_SIZE', 64):
+            partials = [count_shard(self.file_path, start, end)
+                        for start, end in zip(offsets, offsets[1:])]
+            
+        left_frequencies, right_frequencies = merge_frequencies(partials)
+        self.assertEqual(sum(left_frequencies.values()), len(self.left_list))
+        self.assertEqual(
+            similarity_from_frequencies(left_frequencies, right_frequencies),
+            calculate_similarity_score(self.left_list, self.right_list, 'python'),
+        )
+        
+    def test_process_pool(self):
+        """Test the similarity score computed by a pool of workers."""
+        self.assertEqual(
+            calculate_similarity_score_parallel(self.file_path, workers=2),
+            calculate_similarity_score(self.left_list, self.right_list, 'python'),
+        )
@@ -0,0 +1,3 @@
+"""
+Main package initialization.
+"""
@@ -0,0 +1,119 @@
+"""
+Module for validating many reactor level reports at once with NumPy.
+"""
+from itertools import chain
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+def pack_reports(reports):
+    """
+    Pack reports of different lengths into a padded matrix.
+    
+    Args:
+        reports (list): List of reports, where each report is a list of integers
+        
+    Returns:
+        tuple: Matrix with one report per row, padded with zeros,
+            and the vector of report lengths
+    """
+    if np is None:
+        raise ImportError("NumPy is required for the batch validator")
+        
+    lengths = np.fromiter((len(report) for report in reports), dtype=np.int64, count=len(reports))
+    width = int(lengths.max()) if len(reports) else 0
+    matrix = np.zeros((len(reports), width), dtype=np.int64)
+    
+    # Boolean assignment fills the cells in row-major order
+    cells = np.arange(width) < lengths[:, None]
+    matrix[cells] = np.fromiter(chain.from_iterable(reports), dtype=np.int64, count=int(lengths.sum()))
+    
+    return matrix, lengths
+
+def valid_steps(matrix, lengths):
+    """
+    Check every pair of adjacent levels of every report.
+    
+    Steps past the end of a report are padding and always count as valid.
+    
+    Args:
+        matrix (ndarray): Padded matrix of reports
+        lengths (ndarray): Length of each report
+        
+    Returns:
+        tuple: Masks of steps valid for increasing and for decreasing levels
+    """
+    diffs = matrix[:, 1:] - matrix[:, :-1]
+    padding = np.arange(diffs.shape[1]) >= lengths[:, None] - 1
+    increasing = (diffs >= 1) & (diffs <= 3) | padding
+    decreasing = (diffs <= -1) & (diffs >= -3) | padding
+    return increasing, decreasing
+
+def validate_reports(matrix, lengths):
+    """
+    Check which reports are safe.
+    
+    Args:
+        matrix (ndarray): Padded matrix of reports
+        lengths (ndarray): Length of each report
+        
+    Returns:
+        ndarray: Boolean vector, True for every safe report
+    """
+    increasing, decreasing = valid_steps(matrix, lengths)
+    return increasing.all(axis=1) | decreasing.all(axis=1)
+
+def validate_reports_with_dampener(matrix, lengths):
+    """
+    Check which reports are safe, considering the Problem Dampener.
+    
+    Removing level j keeps every step before level j - 1 and after level
+    j + 1, and bridges levels j - 1 and j + 1 with a new step. Prefix and
+    suffix masks of valid steps give the result of every removal column
+    at once.
+    
+    Args:
+        matrix (ndarray): Padded matrix of reports
+        lengths (ndarray): Length of each report
+        
+    Returns:
+        ndarray: Boolean vector, True for every report safe with or without the dampener
+    """
+    rows, width = matrix.shape
+    if width < 3:
+        return np.ones(rows, dtype=bool)
+        
+    safe = validate_reports(matrix, lengths)
+    bridges = matrix[:, 2:] - matrix[:, :-2]
+    bridge_padding = np.arange(2, width) >= lengths[:, None]
+    
+    for steps, low, high in zip(valid_steps(matrix, lengths), (1, -3), (3, -1)):
+        # prefix[:, i] tells if steps[:, :i] are valid, suffix[:, i] if steps[:, i:] are
+        prefix = np.ones((rows, width), dtype=bool)
+        prefix[:, 1:] = np.logical_and.accumulate(steps, axis=1)
+        suffix = np.ones((rows, width), dtype=bool)
+        suffix[:, :-1] = np.logical_and.accumulate(steps[:, ::-1], axis=1)[:, ::-1]
+        
+        bridge_valid = (bridges >= low) & (bridges <= high) | bridge_padding
+        middle = prefix[:, :-2] & suffix[:, 2:] & bridge_valid
+        safe |= suffix[:, 1] | prefix[:, -2] | middle.any(axis=1)
+        
+    return safe
+
+def count_safe_reports_batch(reports, use_dampener=False):
+    """
+    Count the number of safe reports with the vectorized validator.
+    
+    Args:
+        reports (list): List of reports to check
+        use_dampener (bool): Whether to use the Problem Dampener
+        
+    Returns:
+        int: Number of safe reports
+    """
+    matrix, lengths = pack_reports(reports)
+    if use_dampener:
+        return int(validate_reports_with_dampener(matrix, lengths).sum())
+    return int(validate_reports(matrix, lengths).sum())
@@ -2,6 +2,9 @@
 Module for parsing reactor level reports.
 """
 
+# Number of reports per chunk yielded by iter_report_chunks
+DEFAULT_CHUNK_SIZE = 10000
+
 def parse_report(line):
     """
     Parse a single report line into a list of levels.
@@ -35,3 +38,30 @@ def parse_reports_file(file_path):
         return []
         
     return reports
+
+def iter_report_chunks(file_path, chunk_size=DEFAULT_CHUNK_SIZE):
+    """
+    Parse the reports input file lazily, a chunk of reports at a time.
+    
+    Args:
+        file_path (str): Path to input file
+        chunk_size (int): Number of reports per chunk
+        
+    Yields:
+        list: List of at most chunk_size reports
+    """
+    chunk = []
+    
+    try:
+        with open(file_path, 'r') as file:
+            for line in file:
+                chunk.append(parse_report(line))
+                if len(chunk) == chunk_size:
+                    yield chunk
+                    chunk = []
+    except FileNotFoundError:
+        print(f"Error: Input file '{file_path}' not found.")
+        return
+        
+    if chunk:
+        yield chunk
@@ -1,6 +1,9 @@
 """
 Module for validating reactor level reports.
 """
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
 
 def is_monotonic(levels):
     """
@@ -73,17 +76,163 @@ def is_report_safe_with_dampener(levels):
             
     return False
 
-def count_safe_reports(reports, use_dampener=False):
+def find_first_violation(levels, direction, skip=-1):
+    """
+    Find the first level that breaks the rules for a given direction.
+    
+    Args:
+        levels (list): List of level readings
+        direction (int): 1 for increasing levels, -1 for decreasing levels
+        skip (int): Index of a level to ignore, -1 to keep every level
+        
+    Returns:
+        int: Index of the offending level, or -1 if the levels are safe
+    """
+    previous = -1
+    
+    for i in range(len(levels)):
+        if i == skip:
+            continue
+        if previous >= 0:
+            diff = (levels[i] - levels[previous]) * direction
+            if diff < 1 or diff > 3:
+                return i
+        previous = i
+        
+    return -1
+
+def is_report_safe_with_dampener_linear(levels):
+    """
+    Check if a report is safe, considering the Problem Dampener, in linear time.
+    Gives the same answer as is_report_safe_with_dampener without building
+    a new list for every removal: once the first bad pair of levels is found,
+    one of those two levels has to be removed, so only they are tried.
+    
+    Args:
+        levels (list): List of level readings
+        
+    Returns:
+        bool: True if the report is safe with or without using the Problem Dampener
+    """
+    for direction in (1, -1):
+        violation = find_first_violation(levels, direction)
+        if violation == -1:
+            return True
+            
+        # Try removing either level of the first bad pair
+        for skip in (violation - 1, violation):
+            if find_first_violation(levels, direction, skip) == -1:
+                return True
+                
+    return False
+
+def count_min_removals(levels, direction, max_removals):
+    """
+    Count the fewest levels to remove so the remaining ones follow the rules.
+    
+    removals[j] holds the fewest removals among the first j + 1 levels when
+    level j is kept. Since at most max_removals levels can be skipped, the
+    previous kept level is one of the max_removals + 1 levels before it,
+    which makes the whole search O(n * k).
+    
+    Args:
+        levels (list): List of level readings
+        direction (int): 1 for increasing levels, -1 for decreasing levels
+        max_removals (int): Largest number of removals worth counting
+        
+    Returns:
+        int: Fewest removals needed, or max_removals + 1 if more are needed
+    """
+    too_many = max_removals + 1
+    count = len(levels)
+    removals = []
+    best = 0 if count == 0 else too_many
+    
+    for j in range(count):
+        # Remove every level before j
+        fewest = j if j < too_many else too_many
+        for previous in range(max(0, j - too_many), j):
+            skipped = removals[previous] + j - previous - 1
+            if skipped < fewest:
+                diff = (levels[j] - levels[previous]) * direction
+                if 1 <= diff <= 3:
+                    fewest = skipped
+        removals.append(fewest)
+        
+        # Remove every level after j
+        total = fewest + count - 1 - j
+        if total < best:
+            best = total
+            
+    return best
+
+def is_report_safe_with_removals(levels, max_removals):
+    """
+    Check if a report is safe after removing at most max_removals levels.
+    
+    Args:
+        levels (list): List of level readings
+        max_removals (int): Number of faulty levels that can be removed
+        
+    Returns:
+        bool: True if the report can be made safe
+    """
+    return any(
+        count_min_removals(levels, direction, max_removals) <= max_removals
+        for direction in (1, -1)
+    )
+
+def count_safe_reports(reports, use_dampener=False, max_removals=None):
     """
     Count the number of safe reports.
     
     Args:
         reports (list): List of reports to check
         use_dampener (bool): Whether to use the Problem Dampener
+        max_removals (int): Number of faulty levels that can be removed,
+            overrides use_dampener when given
         
     Returns:
         int: Number of safe reports
     """
-    if use_dampener:
-        return sum(1 for report in reports if is_report_safe_with_dampener(report))
-    return sum(1 for report in reports if is_report_safe(report))
+    if max_removals is None:
+        max_removals = 1 if use_dampener else 0
+        
+    if max_removals == 0:
+        return sum(1 for report in reports if is_report_safe(report))
+    if max_removals == 1:
+        return sum(1 for report in reports if is_report_safe_with_dampener_linear(report))
+    return sum(1 for report in reports if is_report_safe_with_removals(report, max_removals))
+
+def count_safe_reports_parallel(report_chunks, use_dampener=False, max_removals=None, workers=None):
+    """
+    Count the number of safe reports, validating chunks in a pool of processes.
+    
+    Chunks are pulled from report_chunks only when a worker is about to
+    need them, so parsing overlaps with validation and at most two chunks
+    per worker are held in memory.
+    
+    Args:
+        report_chunks (iterable): Lists of reports, e.g. from iter_report_chunks
+        use_dampener (bool): Whether to use the Problem Dampener
+        max_removals (int): Number of faulty levels that can be removed,
+            overrides use_dampener when given
+        workers (int): Number of worker processes, defaults to the CPU count
+        
+    Returns:
+        int: Number of safe reports
+    """
+    workers = workers or os.cpu_count() or 1
+    pending = deque()
+    safe_count = 0
+    
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        for chunk in report_chunks:
+            if len(pending) >= 2 * workers:
+                safe_count += pending.popleft().result()
+            pending.append(executor.submit(count_safe_reports, chunk, use_dampener, max_removals))
+            
+        while pending:
+            safe_count += pending.popleft().result()
+            
+    return safe_count
@@ -0,0 +1,35 @@
+"""
+Test cases for batch validator module.
+python -m unittest discover -s tests -v
+"""
+import random
+import unittest
+from src import batch_validator
+from src.report_validator import is_report_safe, is_report_safe_with_dampener
+from tests.test_report_validator import EXAMPLE_REPORTS, random_report
+
+@unittest.skipIf(batch_validator.np is None, "NumPy is not installed")
+class TestBatchValidator(unittest.TestCase):
+    """Test cases for the vectorized report validator."""
+    
+    def test_pack_reports(self):
+        """Test reports of different lengths are padded with zeros."""
+        matrix, lengths = batch_validator.pack_reports([[1, 2, 3], [4], []])
+        self.assertEqual(matrix.tolist(), [[1, 2, 3], [4, 0, 0], [0, 0, 0]])
+        self.assertEqual(lengths.tolist(), [3, 1, 0])
+        
+    def test_example(self):
+        """Test safe report counts with example from problem description."""
+        self.assertEqual(batch_validator.count_safe_reports_batch(EXAMPLE_REPORTS), 2)
+        self.assertEqual(batch_validator.count_safe_reports_batch(EXAMPLE_REPORTS, use_dampener=True), 4)
+        
+    def test_matches_report_validator(self):
+        """Test every report of a random batch against the scalar checks."""
+        rng = random.Random(2024)
+        reports = [random_report(rng) for _ in range(5000)] + [[], [3], [3, 3]]
+        matrix, lengths = batch_validator.pack_reports(reports)
+        
+        safe = batch_validator.validate_reports(matrix, lengths).tolist()
+        safe_with_dampener = batch_validator.validate_reports_with_dampener(matrix, lengths).tolist()
+        self.assertEqual(safe, [is_report_safe(report) for report in reports])
+        self.assertEqual(safe_with_dampener, [is_report_safe_with_dampener(report) for report in reports])
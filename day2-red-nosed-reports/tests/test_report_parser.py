@@ -0,0 +1,32 @@
+"""
+Test cases for report parser module.
+python -m unittest discover -s tests -v
+"""
+import os
+import tempfile
+import unittest
+from src.report_parser import iter_report_chunks, parse_reports_file
+
+class TestReportParser(unittest.TestCase):
+    """Test cases for report parsing functionality."""
+    
+    def setUp(self):
+        """Write a few reports to a file."""
+        handle, self.file_path = tempfile.mkstemp()
+        with os.fdopen(handle, 'w') as file:
+            file.write("7 6 4 2 1\n1 2 7 8 9\n9 7 6 2 1\n1 3 2 4 5\n8 6 4 4 1\n")
+            
+    def tearDown(self):
+        """Remove the reports file."""
+        os.remove(self.file_path)
+        
+    def test_chunks_cover_every_report(self):
+        """Test the chunks hold the same reports as the whole-file parser."""
+        chunks = list(iter_report_chunks(self.file_path, chunk_size=2))
+        self.assertEqual([len(chunk) for chunk in chunks], [2, 2, 1])
+        self.assertEqual([report for chunk in chunks for report in chunk],
+                         parse_reports_file(self.file_path))
+        
+    def test_missing_file(self):
+        """Test with a missing input file."""
+        self.assertEqual(list(iter_report_chunks(self.file_path + '.missing')), [])
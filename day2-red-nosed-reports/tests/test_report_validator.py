@@ -0,0 +1,96 @@
+"""
+Test cases for report validator module.
+python -m unittest discover -s tests -v
+"""
+import random
+import unittest
+from itertools import combinations
+from src.report_validator import (
+    count_safe_reports,
+    count_safe_reports_parallel,
+    is_report_safe,
+    is_report_safe_with_dampener,
+    is_report_safe_with_dampener_linear,
+    is_report_safe_with_removals,
+)
+
+EXAMPLE_REPORTS = [
+    [7, 6, 4, 2, 1],
+    [1, 2, 7, 8, 9],
+    [9, 7, 6, 2, 1],
+    [1, 3, 2, 4, 5],
+    [8, 6, 4, 4, 1],
+    [1, 3, 6, 7, 9],
+]
+
+def random_report(rng, max_length=8):
+    """Build a report whose steps are often, but not always, valid."""
+    levels = [rng.randrange(100)]
+    for _ in range(rng.randrange(max_length)):
+        levels.append(levels[-1] + rng.choice((-4, -3, -2, -1, 0, 1, 2, 3, 4)))
+    return levels
+
+def is_safe_by_brute_force(levels, max_removals):
+    """Try every subset of at most max_removals levels to remove."""
+    for removals in range(max_removals + 1):
+        for removed in combinations(range(len(levels)), removals):
+            if is_report_safe([level for i, level in enumerate(levels) if i not in removed]):
+                return True
+    return False
+
+class TestReportValidator(unittest.TestCase):
+    """Test cases for report validation functionality."""
+    
+    def test_example_without_dampener(self):
+        """Test safe report count with example from problem description."""
+        self.assertEqual(count_safe_reports(EXAMPLE_REPORTS), 2)
+        
+    def test_example_with_dampener(self):
+        """Test safe report count with the Problem Dampener."""
+        self.assertEqual(count_safe_reports(EXAMPLE_REPORTS, use_dampener=True), 4)
+        
+    def test_short_reports(self):
+        """Test reports too short to break any rule."""
+        for levels in ([], [5], [5, 5]):
+            self.assertTrue(is_report_safe_with_dampener_linear(levels))
+        self.assertFalse(is_report_safe([5, 5]))
+        
+    def test_linear_dampener_matches_brute_force(self):
+        """Test the linear dampener against removing every level in turn."""
+        rng = random.Random(2024)
+        for _ in range(5000):
+            levels = random_report(rng)
+            with self.subTest(levels=levels):
+                self.assertEqual(
+                    is_report_safe_with_dampener_linear(levels),
+                    is_report_safe_with_dampener(levels),
+                )
+                
+    def test_max_removals_matches_dampener(self):
+        """Test one allowed removal behaves like the Problem Dampener."""
+        self.assertEqual(count_safe_reports(EXAMPLE_REPORTS, max_removals=0), 2)
+        self.assertEqual(count_safe_reports(EXAMPLE_REPORTS, max_removals=1), 4)
+        
+    def test_k_removals_matches_brute_force(self):
+        """Test the k-removal engine against trying every subset of levels."""
+        rng = random.Random(2025)
+        for _ in range(1500):
+            levels = random_report(rng, max_length=9)
+            for max_removals in range(4):
+                with self.subTest(levels=levels, max_removals=max_removals):
+                    self.assertEqual(
+                        is_report_safe_with_removals(levels, max_removals),
+                        is_safe_by_brute_force(levels, max_removals),
+                    )
+                    
+    def test_parallel_chunks(self):
+        """Test counting chunks of reports in a pool of processes."""
+        rng = random.Random(2026)
+        reports = [random_report(rng) for _ in range(1000)]
+        chunks = [reports[i:i + 70] for i in range(0, len(reports), 70)]
+        for max_removals in (0, 1, 2):
+            with self.subTest(max_removals=max_removals):
+                self.assertEqual(
+                    count_safe_reports_parallel(iter(chunks), max_removals=max_removals, workers=2),
+                    count_safe_reports(reports, max_removals=max_removals),
+                )
@@ -0,0 +1,197 @@
+"""
+Benchmarks for the Mull It Over instruction scanners.
+"""
+
+import random
+import re
+import string
+import time
+import tracemalloc
+from itertools import product
+
+from calculator import calculate_total, calculate_totals
+from instruction_parser import (
+    find_valid_instructions,
+    get_enabled_instructions,
+    parse_instruction,
+)
+from instruction_set import default_instruction_set
+
+
+def generate_memory(size, seed=2024):
+    """
+    Generate corrupted memory sprinkled with valid and broken instructions.
+
+    Args:
+        size (int): Approximate number of characters to generate
+        seed (int): Seed of the random generator
+
+    Returns:
+        str: Corrupted memory contents
+    """
+    rng = random.Random(seed)
+    noise = "()[]{}<>,;:!?@#$%^&*-+/ '~whatselectfromhowwhenwhy"
+    pieces = []
+    length = 0
+
+    while length < size:
+        roll = rng.random()
+        if roll < 0.3:
+            piece = f"mul({rng.randrange(1000)},{rng.randrange(1000)})"
+        elif roll < 0.35:
+            piece = "do()"
+        elif roll < 0.4:
+            piece = "don't()"
+        elif roll < 0.5:
+            piece = f"mul({rng.randrange(1000)}, {rng.randrange(1000)}]"
+        else:
+            piece = "".join(rng.choice(noise) for _ in range(rng.randrange(1, 12)))
+        pieces.append(piece)
+        length += len(piece)
+
+    return "".join(pieces)
+
+
+def find_valid_instructions_multipass(memory):
+    """
+    Reference scanner running one regex pass per instruction type.
+
+    Args:
+        memory (str): Corrupted memory contents
+
+    Returns:
+        list: Parsed instructions in order of appearance
+    """
+    patterns = [r"mul\(\d{1,3},\d{1,3}\)", r"do\(\)", r"don't\(\)"]
+    instructions = []
+
+    for pattern in patterns:
+        for match in re.finditer(pattern, memory):
+            instruction = parse_instruction(match.group(), match.start())
+            if instruction:
+                instructions.append(instruction)
+
+    return sorted(instructions, key=lambda x: x.position)
+
+
+def best_time(function, *args, repeat=5):
+    """
+    Run a function several times and return its fastest run in seconds.
+    """
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function(*args)
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def benchmark_scanners(memory):
+    """
+    Compare the single-pass scanner with the multi-pass reference.
+    """
+    assert find_valid_instructions(memory) == find_valid_instructions_multipass(memory)
+
+    multipass = best_time(find_valid_instructions_multipass, memory)
+    single_pass = best_time(find_valid_instructions, memory)
+    print(f"Multi-pass scanner:  {multipass * 1000:8.1f} ms")
+    print(f"Single-pass scanner: {single_pass * 1000:8.1f} ms ({multipass / single_pass:.1f}x)")
+
+
+def calculate_totals_with_lists(memory):
+    """
+    Reference evaluator building the instruction lists of the original pipeline.
+
+    Args:
+        memory (str): Corrupted memory contents
+
+    Returns:
+        tuple: Sum of all multiplication results and sum of enabled ones
+    """
+    instructions = find_valid_instructions(memory)
+    part1_instructions = [
+        (i.numbers[0], i.numbers[1]) for i in instructions if i.type == "mul" and i.numbers
+    ]
+    enabled_instructions = get_enabled_instructions(instructions)
+    return calculate_total(part1_instructions), calculate_total(enabled_instructions)
+
+
+def traced_peak(function, *args):
+    """
+    Run a function under tracemalloc and return its peak traced memory in bytes.
+    """
+    tracemalloc.start()
+    try:
+        function(*args)
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def benchmark_evaluators(memory):
+    """
+    Compare time and peak allocations of the fused evaluator with the list pipeline.
+    """
+    assert calculate_totals(memory) == calculate_totals_with_lists(memory)
+
+    with_lists = best_time(calculate_totals_with_lists, memory)
+    fused = best_time(calculate_totals, memory)
+    with_lists_peak = traced_peak(calculate_totals_with_lists, memory)
+    fused_peak = traced_peak(calculate_totals, memory)
+    print(f"List pipeline:   {with_lists * 1000:8.1f} ms, peak {with_lists_peak / 1024:10.1f} KiB")
+    print(f"Fused evaluator: {fused * 1000:8.1f} ms, peak {fused_peak / 1024:10.1f} KiB")
+
+
+def build_instruction_sets(extra_opcodes):
+    """
+    Build the default instruction set and an equivalent regex with extra opcodes.
+
+    Args:
+        extra_opcodes (int): Number of unary opcodes registered on top of the default ones
+
+    Returns:
+        tuple: The instruction set and the compiled alternation of all its opcodes
+    """
+    instruction_set = default_instruction_set()
+    names = ("".join(letters) for letters in product(string.ascii_lowercase, repeat=4))
+    for name in list(names)[:extra_opcodes]:
+        instruction_set.register(f"x{name}", arity=1)
+
+    alternatives = []
+    for opcode in instruction_set.opcodes:
+        arguments = ",".join([rf"\d{{1,{opcode.max_digits}}}"] * opcode.arity)
+        alternatives.append(re.escape(opcode.name) + r"\(" + arguments + r"\)")
+    return instruction_set, re.compile("|".join(alternatives).encode())
+
+
+def benchmark_tokenizers(memory):
+    """
+    Compare tokens per second of the compiled scanner and of a flat regex alternation.
+    """
+    data = memory.encode()
+
+    for extra_opcodes in (0, 16, 256):
+        instruction_set, pattern = build_instruction_sets(extra_opcodes)
+        scanner = instruction_set.compile()
+        tokens = sum(1 for _ in scanner.tokenize(data))
+        assert tokens == sum(1 for _ in pattern.finditer(data))
+
+        compiled = best_time(lambda: sum(1 for _ in scanner.token_pattern.finditer(data)), repeat=3)
+        decoded = best_time(lambda: sum(1 for _ in scanner.tokenize(data)), repeat=3)
+        flat = best_time(lambda: sum(1 for _ in pattern.finditer(data)), repeat=3)
+        print(
+            f"{len(instruction_set.opcodes):4} opcodes: "
+            f"scanner {tokens / compiled / 1e6:6.2f}M tokens/s "
+            f"({tokens / decoded / 1e6:.2f}M decoded), "
+            f"flat alternation {tokens / flat / 1e6:6.2f}M tokens/s"
+        )
+
+
+if __name__ == "__main__":
+    benchmark_memory = generate_memory(5_000_000)
+    print(f"Scanning {len(benchmark_memory):,} characters of corrupted memory\n")
+    benchmark_scanners(benchmark_memory)
+    print()
+    benchmark_evaluators(benchmark_memory)
+    print()
+    benchmark_tokenizers(benchmark_memory)
@@ -2,6 +2,24 @@
 Module for performing calculations on multiplication instructions.
 """
 
+import mmap
+import os
+
+from instruction_parser import (
+    DEFAULT_WINDOW_SIZE,
+    INSTRUCTION_BYTES_PATTERN,
+    INSTRUCTION_PATTERN,
+    SCANNER,
+    iter_window_matches,
+)
+
+# Positions of the mul arguments in match.groups(), and marker groups of
+# do() and don't(), other opcodes are ignored
+MUL_X = SCANNER.groups[SCANNER.group("mul")][1] - 1
+MUL_Y = MUL_X + 1
+DO_GROUP = SCANNER.group("do")
+DONT_GROUP = SCANNER.group("don't")
+
 
 def calculate_instruction(x, y):
     """
@@ -28,3 +46,71 @@ def calculate_total(instructions):
         int: Sum of all multiplication results
     """
     return sum(calculate_instruction(x, y) for x, y in instructions)
+
+
+def total_matches(matches):
+    """
+    Fold scanner matches into both totals as soon as they are found.
+
+    No instruction records or intermediate lists are built.
+
+    Args:
+        matches (iterable): Matches of the instruction scanner in order of appearance
+
+    Returns:
+        tuple: Sum of all multiplication results and sum of enabled ones
+    """
+    total = enabled_total = 0
+    enabled = True
+
+    for match in matches:
+        arguments = match.groups()
+        x = arguments[MUL_X]
+        if x is None:
+            group = match.lastindex
+            if group == DO_GROUP:
+                enabled = True
+            elif group == DONT_GROUP:
+                enabled = False
+            continue
+        product = int(x) * int(arguments[MUL_Y])
+        total += product
+        if enabled:
+            enabled_total += product
+
+    return total, enabled_total
+
+
+def calculate_totals(memory):
+    """
+    Calculate both totals in a single pass straight from the scanner.
+
+    Args:
+        memory: Corrupted memory contents, as a str or a bytes-like object
+
+    Returns:
+        tuple: Sum of all multiplication results and sum of enabled ones
+    """
+    pattern = INSTRUCTION_PATTERN if isinstance(memory, str) else INSTRUCTION_BYTES_PATTERN
+    return total_matches(pattern.finditer(memory))
+
+
+def calculate_file_totals(file_path, window_size=DEFAULT_WINDOW_SIZE):
+    """
+    Calculate both totals of a memory dump file without loading it.
+
+    The file is memory-mapped and scanned in fixed-size windows, so memory
+    use does not grow with the size of the dump.
+
+    Args:
+        file_path (str): Path to the memory dump
+        window_size (int): Number of bytes scanned at a time
+
+    Returns:
+        tuple: Sum of all multiplication results and sum of enabled ones
+    """
+    with open(file_path, "rb") as file:
+        if os.fstat(file.fileno()).st_size == 0:
+            return 0, 0
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as memory:
+            return total_matches(iter_window_matches(memory, 0, len(memory), window_size))
@@ -4,16 +4,32 @@ Module for parsing multiplication instructions from corrupted memory.
 
 import re
 from dataclasses import dataclass
-from typing import Optional, List, Tuple
+from typing import Iterable, Iterator, Optional, List, Tuple
 
+from instruction_set import default_instruction_set
 
-@dataclass
+
+# Single scanner compiled from the instruction set of the challenge
+SCANNER = default_instruction_set().compile()
+
+# Scanner regex over str, and the same for memory read as bytes
+INSTRUCTION_PATTERN = SCANNER.pattern
+INSTRUCTION_BYTES_PATTERN = SCANNER.bytes_pattern
+
+# Longest possible instruction, mul(123,456)
+MAX_INSTRUCTION_LENGTH = SCANNER.max_length
+
+# Number of bytes scanned at a time when streaming memory dumps
+DEFAULT_WINDOW_SIZE = 1 << 20
+
+
+@dataclass(slots=True)
 class Instruction:
     """Represents a parsed instruction with its position in memory."""
 
-    type: str  # 'mul', 'do', or 'don't'
+    type: str  # opcode name, e.g. 'mul', 'do', or 'don't'
     position: int
-    numbers: Optional[Tuple[int, int]] = None
+    numbers: Optional[Tuple[int, ...]] = None
 
 
 def parse_instruction(text: str, position: int) -> Optional[Instruction]:
@@ -27,21 +43,47 @@ def parse_instruction(text: str, position: int) -> Optional[Instruction]:
     Returns:
         Optional[Instruction]: Parsed instruction or None if invalid
     """
-    # Check for do() and don't() instructions
-    if text == "do()":
-        return Instruction(type="do", position=position)
-    if text == "don't()":
-        return Instruction(type="don't", position=position)
+    match = INSTRUCTION_PATTERN.match(text)
+    if match is None:
+        return None
 
-    # Check for multiplication instruction
-    mul_pattern = r"mul\((\d{1,3}),(\d{1,3})\)"
-    match = re.match(mul_pattern, text)
+    name, numbers = SCANNER.decode(match)
+    return Instruction(type=name, position=position, numbers=numbers or None)
 
-    if match:
-        x, y = map(int, match.groups())
-        return Instruction(type="mul", position=position, numbers=(x, y))
 
-    return None
+def decode_matches(matches: Iterable[re.Match]) -> Iterator[Instruction]:
+    """
+    Turn scanner matches into instructions, reading the arguments from their groups.
+
+    Args:
+        matches (Iterable[re.Match]): Matches of the scanner in order of appearance
+
+    Yields:
+        Instruction: Parsed instructions in order of appearance
+    """
+    groups = SCANNER.groups
+    for match in matches:
+        name, first, arity = groups[match.lastindex]
+        if arity == 2:
+            numbers = (int(match[first]), int(match[first + 1]))
+        elif arity == 0:
+            numbers = None
+        else:
+            numbers = tuple(map(int, match.group(0, *range(first, first + arity))[1:]))
+        yield Instruction(type=name, position=match.start(), numbers=numbers)
+
+
+def iter_instructions(memory: str) -> Iterator[Instruction]:
+    """
+    Scan corrupted memory once for all valid instructions.
+
+    Args:
+        memory (str): Corrupted memory contents
+
+    Yields:
+        Instruction: Parsed instructions in order of appearance
+    """
+    return decode_matches(INSTRUCTION_PATTERN.finditer(memory))
 
 
 def find_valid_instructions(memory: str) -> List[Instruction]:
@@ -54,38 +96,75 @@ def find_valid_instructions(memory: str) -> List[Instruction]:
     Returns:
         List[Instruction]: List of parsed instructions in order of appearance
     """
-    # Find all potential instructions
-    patterns = [
-        r"mul\(\d{1,3},\d{1,3}\)",  # multiplication
-        r"do\(\)",  # enable
-        r"don't\(\)",  # disable
-    ]
+    return list(iter_instructions(memory))
 
-    instructions = []
 
-    # Find all matches for each pattern
-    for pattern in patterns:
-        for match in re.finditer(pattern, memory):
-            instruction = parse_instruction(match.group(), match.start())
-            if instruction:
-                instructions.append(instruction)
+def iter_window_matches(
+    buffer, start: int, end: int, window_size: int = DEFAULT_WINDOW_SIZE
+) -> Iterator["re.Match[bytes]"]:
+    """
+    Scan a range of a bytes-like buffer for instruction matches, one window at a time.
 
-    # Sort instructions by position to maintain order
-    return sorted(instructions, key=lambda x: x.position)
+    Every window is scanned a few bytes past its end so that instructions
+    straddling the boundary are found by the window they start in. Likewise,
+    instructions starting before end are reported even if they finish past it.
 
+    Args:
+        buffer: Bytes-like memory contents, e.g. a bytes object or an mmap
+        start (int): Offset where scanning starts
+        end (int): Offset where instructions may no longer start
+        window_size (int): Number of bytes scanned at a time
 
-def get_enabled_instructions(instructions: List[Instruction]) -> List[Tuple[int, int]]:
+    Yields:
+        re.Match: Matches of INSTRUCTION_BYTES_PATTERN in order of appearance
     """
-    Filter instructions based on do() and don't() conditions.
+    position = start
+
+    while position < end:
+        window_end = min(position + window_size, end)
+        scan_end = min(window_end + MAX_INSTRUCTION_LENGTH - 1, len(buffer))
+        next_position = window_end
+
+        for match in INSTRUCTION_BYTES_PATTERN.finditer(buffer, position, scan_end):
+            if match.start() >= window_end:
+                break
+            next_position = max(next_position, match.end())
+            yield match
+
+        position = next_position
+
+
+def iter_window_instructions(
+    buffer, start: int, end: int, window_size: int = DEFAULT_WINDOW_SIZE
+) -> Iterator[Instruction]:
+    """
+    Scan a range of a bytes-like buffer for instructions, one window at a time.
 
     Args:
-        instructions (List[Instruction]): List of all parsed instructions
+        buffer: Bytes-like memory contents, e.g. a bytes object or an mmap
+        start (int): Offset where scanning starts
+        end (int): Offset where instructions may no longer start
+        window_size (int): Number of bytes scanned at a time
 
-    Returns:
-        List[Tuple[int, int]]: List of number pairs from enabled mul instructions
+    Yields:
+        Instruction: Parsed instructions in order of appearance
+    """
+    return decode_matches(iter_window_matches(buffer, start, end, window_size))
+
+
+def iter_enabled_instructions(instructions: Iterable[Instruction]) -> Iterator[Tuple[int, int]]:
+    """
+    Lazily filter instructions based on do() and don't() conditions.
+
+    The enabled state carries over the whole stream, however it was scanned.
+
+    Args:
+        instructions (Iterable[Instruction]): Parsed instructions in order of appearance
+
+    Yields:
+        Tuple[int, int]: Number pairs from enabled mul instructions
     """
     enabled = True  # Instructions are enabled by default
-    enabled_muls = []
 
     for instruction in instructions:
         if instruction.type == "do":
@@ -93,6 +172,17 @@ def get_enabled_instructions(instructions: List[Instruction]) -> List[Tuple[int,
         elif instruction.type == "don't":
             enabled = False
         elif instruction.type == "mul" and enabled and instruction.numbers:
-            enabled_muls.append(instruction.numbers)
+            yield instruction.numbers
+
+
+def get_enabled_instructions(instructions: List[Instruction]) -> List[Tuple[int, int]]:
+    """
+    Filter instructions based on do() and don't() conditions.
 
-    return enabled_muls
+    Args:
+        instructions (List[Instruction]): List of all parsed instructions
+
+    Returns:
+        List[Tuple[int, int]]: List of number pairs from enabled mul instructions
+    """
+    return list(iter_enabled_instructions(instructions))
@@ -0,0 +1,212 @@
+"""
+Module for declaring instruction sets and compiling them into a single scanner.
+"""
+
+import re
+from dataclasses import dataclass
+from typing import Dict, Iterator, Optional, Tuple
+
+# Bytes that cannot appear in an opcode name
+RESERVED_BYTES = b"(),0123456789"
+
+
+@dataclass(frozen=True)
+class Opcode:
+    """Declares an instruction written as name(arg,arg,...) with numeric arguments."""
+
+    name: str
+    arity: int = 0
+    max_digits: int = 3
+
+    @property
+    def max_length(self) -> int:
+        """Length in bytes of the longest possible instruction, e.g. 12 for mul(123,456)."""
+        separators = max(self.arity - 1, 0)
+        return len(self.name.encode()) + 2 + self.arity * self.max_digits + separators
+
+    def arguments_pattern(self, capture: bool) -> str:
+        """
+        Spell the argument list as a regex.
+
+        When capturing, each argument gets a group, and an opcode without
+        arguments gets an empty group instead, so the last group of a match
+        tells which opcode it is.
+        """
+        number = rf"(\d{{1,{self.max_digits}}})" if capture else rf"\d{{1,{self.max_digits}}}"
+        arguments = ",".join([number] * self.arity)
+        marker = "()" if capture and not self.arity else ""
+        return r"\(" + arguments + r"\)" + marker
+
+
+@dataclass(frozen=True)
+class Scanner:
+    """
+    Regexes recognizing every instruction of an instruction set.
+
+    The opcode names are factored into a trie, so the regex engine tests
+    each byte against the names sharing a prefix at once instead of trying
+    every opcode in turn. A name can never be followed by another name's
+    continuation and "(" at the same offset, so at most one opcode matches
+    at any offset and the order of the alternatives does not matter.
+
+    CPython fills every group of the pattern for each match, so the
+    tokenizer runs the trie without groups and reads the arguments back
+    from the matched bytes, at a cost that does not grow with the number of
+    opcodes. The patterns with groups let callers decode matches in place.
+    """
+
+    pattern: "re.Pattern[str]"  # trie with argument and marker groups
+    bytes_pattern: "re.Pattern[bytes]"  # same for memory read as bytes
+    token_pattern: "re.Pattern[bytes]"  # trie without groups, for tokenize
+    # Name, first argument group and arity of the opcode closing each group
+    groups: Dict[int, Tuple[str, int, int]]
+    names: Dict[bytes, str]  # opcode name of each encoded name
+    max_length: int  # length of the longest possible instruction
+
+    def group(self, name: str) -> int:
+        """
+        Return the index of the last group of the given opcode.
+        """
+        for group, (opcode, _, _) in self.groups.items():
+            if opcode == name:
+                return group
+        raise KeyError(name)
+
+    def decode(self, match: re.Match) -> Tuple[str, Tuple[int, ...]]:
+        """
+        Return the opcode name and arguments of a match of pattern or bytes_pattern.
+        """
+        name, first, arity = self.groups[match.lastindex]
+        if arity == 0:
+            return name, ()
+        if arity == 1:
+            return name, (int(match[first]),)
+        return name, tuple(map(int, match.group(*range(first, first + arity))))
+
+    def tokenize(self, data: bytes) -> Iterator[Tuple[str, Tuple[int, ...], int]]:
+        """
+        Find every instruction in memory.
+
+        Args:
+            data (bytes): Corrupted memory contents as a bytes-like object
+
+        Yields:
+            Tuple[str, Tuple[int, ...], int]: Opcode name, arguments and offset
+        """
+        names = self.names
+        for match in self.token_pattern.finditer(data):
+            text = match[0]
+            paren = text.index(b"(")
+            arguments = text[paren + 1 : -1]
+            numbers = tuple(map(int, arguments.split(b","))) if arguments else ()
+            yield names[text[:paren]], numbers, match.start()
+
+
+class InstructionSet:
+    """Registry of opcodes, compiled on demand into a Scanner."""
+
+    def __init__(self):
+        self._opcodes: Dict[str, Opcode] = {}
+        self._scanner: Optional[Scanner] = None
+
+    def register(self, name: str, arity: int = 0, max_digits: int = 3) -> Opcode:
+        """
+        Declare a new instruction.
+
+        Args:
+            name (str): Opcode name, e.g. "mul"
+            arity (int): Number of numeric arguments
+            max_digits (int): Largest number of digits of each argument
+
+        Returns:
+            Opcode: The registered opcode
+        """
+        encoded = name.encode()
+        if not encoded or any(byte in RESERVED_BYTES for byte in encoded):
+            raise ValueError(f"Invalid opcode name: {name!r}")
+        if arity < 0 or max_digits < 1:
+            raise ValueError(f"Invalid argument shape for opcode {name!r}")
+
+        opcode = Opcode(name=name, arity=arity, max_digits=max_digits)
+        self._opcodes[name] = opcode
+        self._scanner = None
+        return opcode
+
+    @property
+    def opcodes(self) -> Tuple[Opcode, ...]:
+        return tuple(self._opcodes.values())
+
+    def compile(self) -> Scanner:
+        """
+        Build the scanner regexes of all registered opcodes from a trie of their names.
+
+        Returns:
+            Scanner: Scanner recognizing every registered opcode
+        """
+        if self._scanner is not None:
+            return self._scanner
+        if not self._opcodes:
+            raise ValueError("Cannot compile an empty instruction set")
+
+        trie: Dict = {}
+        for opcode in self.opcodes:
+            node = trie
+            for char in opcode.name:
+                node = node.setdefault(char, {})
+            node[None] = opcode
+
+        groups: Dict[int, Tuple[str, int, int]] = {}
+        count = 0
+
+        def spell(node, capture: bool) -> str:
+            """Spell a trie node as a regex, numbering groups from left to right."""
+            nonlocal count
+            branches = []
+            for char, child in node.items():
+                if char is None:
+                    if capture:
+                        # One group per argument, or a single marker group
+                        first = count + 1
+                        count += max(child.arity, 1)
+                        groups[count] = (child.name, first, child.arity)
+                    branches.append(child.arguments_pattern(capture))
+                else:
+                    branches.append(re.escape(char) + spell(child, capture))
+            return branches[0] if len(branches) == 1 else "(?:" + "|".join(branches) + ")"
+
+        source = spell(trie, capture=True)
+        self._scanner = Scanner(
+            pattern=re.compile(source),
+            bytes_pattern=re.compile(source.encode()),
+            token_pattern=re.compile(spell(trie, capture=False).encode()),
+            groups=groups,
+            names={opcode.name.encode(): opcode.name for opcode in self.opcodes},
+            max_length=max(opcode.max_length for opcode in self.opcodes),
+        )
+        return self._scanner
+
+    def tokenize(self, data: bytes) -> Iterator[Tuple[str, Tuple[int, ...], int]]:
+        """
+        Find every registered instruction in memory.
+
+        Args:
+            data (bytes): Corrupted memory contents as a bytes-like object
+
+        Yields:
+            Tuple[str, Tuple[int, ...], int]: Opcode name, arguments and offset
+        """
+        return self.compile().tokenize(data)
+
+
+def default_instruction_set() -> InstructionSet:
+    """
+    Build the instruction set of the Mull It Over challenge.
+
+    Returns:
+        InstructionSet: Registry holding mul(x,y), do() and don't()
+    """
+    instruction_set = InstructionSet()
+    instruction_set.register("mul", arity=2)
+    instruction_set.register("do")
+    instruction_set.register("don't")
+    return instruction_set
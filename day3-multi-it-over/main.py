@@ -2,39 +2,32 @@
 Main application for solving the Mull It Over challenge.
 """
 
-from instruction_parser import find_valid_instructions, get_enabled_instructions
-from calculator import calculate_total
+from calculator import calculate_file_totals, calculate_totals
 
 
-def solve_challenge():
+def solve_challenge(streaming=False):
     """
     Main function to solve the Mull It Over challenge.
+
+    Args:
+        streaming (bool): Scan the memory-mapped input in windows instead of
+            loading it whole, for dumps that do not fit in memory
     """
     print("Day 3: Mull It Over")
     print("------------------")
 
     try:
-        with open("input.txt", "r") as file:
-            memory = file.read().strip()
+        if streaming:
+            total_part1, total_part2 = calculate_file_totals("input.txt")
+        else:
+            with open("input.txt", "r") as file:
+                memory = file.read().strip()
+            # Part 1 and Part 2 totals in a single pass over the memory
+            total_part1, total_part2 = calculate_totals(memory)
     except FileNotFoundError:
         print("Error: Input file 'input.txt' not found.")
         return
 
-    # Find all instructions
-    instructions = find_valid_instructions(memory)
-
-    # Part 1: Calculate total of all multiplication results
-    part1_instructions = [
-        (i.numbers[0], i.numbers[1])
-        for i in instructions
-        if i.type == "mul" and i.numbers
-    ]
-    total_part1 = calculate_total(part1_instructions)
-
-    # Part 2: Calculate total of enabled multiplication results
-    enabled_instructions = get_enabled_instructions(instructions)
-    total_part2 = calculate_total(enabled_instructions)
-
     print(f"\nResults:")
     print(f"Part 1 - Sum of all multiplication results: {total_part1}")
     print(f"Part 2 - Sum of enabled multiplication results: {total_part2}")
@@ -0,0 +1,135 @@
+"""
+Module for evaluating large memory dumps in parallel segments.
+"""
+
+import mmap
+import os
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from functools import reduce
+from itertools import repeat
+from typing import Iterable, Optional, Tuple
+
+from instruction_parser import Instruction, iter_window_instructions
+
+
+@dataclass(frozen=True)
+class SegmentSummary:
+    """
+    Summarizes a segment of memory for both states it can be entered in.
+
+    Whether a mul counts for part 2 only depends on the last do() or don't()
+    before it, so a segment is fully described by its sums when entered
+    enabled or disabled and by the state it leaves behind. Combining two
+    summaries is associative, so segments can be evaluated independently.
+    """
+
+    total: int  # sum of every mul, regardless of state
+    enabled_total: int  # sum of enabled muls when entered enabled
+    disabled_total: int  # sum of enabled muls when entered disabled
+    exit_state: Optional[bool] = None  # state set by the last do()/don't(), if any
+
+    def leave(self, enabled: bool) -> bool:
+        """
+        Return the state after the segment when it is entered in the given state.
+        """
+        return enabled if self.exit_state is None else self.exit_state
+
+    def combine(self, other: "SegmentSummary") -> "SegmentSummary":
+        """
+        Summarize this segment directly followed by another one.
+        """
+        return SegmentSummary(
+            total=self.total + other.total,
+            enabled_total=self.enabled_total
+            + (other.enabled_total if self.leave(True) else other.disabled_total),
+            disabled_total=self.disabled_total
+            + (other.enabled_total if self.leave(False) else other.disabled_total),
+            exit_state=self.exit_state if other.exit_state is None else other.exit_state,
+        )
+
+
+EMPTY_SUMMARY = SegmentSummary(total=0, enabled_total=0, disabled_total=0)
+
+
+def summarize_instructions(instructions: Iterable[Instruction]) -> SegmentSummary:
+    """
+    Summarize a segment from its instructions.
+
+    Args:
+        instructions (Iterable[Instruction]): Instructions of the segment in order
+
+    Returns:
+        SegmentSummary: Summary of the segment
+    """
+    total = enabled_total = disabled_total = 0
+    from_enabled, from_disabled = True, False
+    exit_state = None
+
+    for instruction in instructions:
+        if instruction.type == "do":
+            from_enabled = from_disabled = exit_state = True
+        elif instruction.type == "don't":
+            from_enabled = from_disabled = exit_state = False
+        elif instruction.type == "mul" and instruction.numbers:
+            product = instruction.numbers[0] * instruction.numbers[1]
+            total += product
+            if from_enabled:
+                enabled_total += product
+            if from_disabled:
+                disabled_total += product
+
+    return SegmentSummary(total, enabled_total, disabled_total, exit_state)
+
+
+def summarize_file_segment(file_path: str, start: int, end: int) -> SegmentSummary:
+    """
+    Summarize the instructions starting within a byte range of a memory dump.
+
+    Args:
+        file_path (str): Path to the memory dump
+        start (int): Offset of the first byte of the segment
+        end (int): Offset just past the last byte of the segment
+
+    Returns:
+        SegmentSummary: Summary of the segment
+    """
+    with open(file_path, "rb") as file:
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as memory:
+            return summarize_instructions(iter_window_instructions(memory, start, end))
+
+
+def evaluate_file_parallel(
+    file_path: str, workers: Optional[int] = None, segments: Optional[int] = None
+) -> Tuple[int, int]:
+    """
+    Calculate both totals of a memory dump using a pool of processes.
+
+    The dump is cut into byte ranges anywhere: an instruction belongs to the
+    segment it starts in, and no valid instruction can start inside another
+    one, so every instruction is counted exactly once.
+
+    Args:
+        file_path (str): Path to the memory dump
+        workers (int): Number of worker processes, defaults to the CPU count
+        segments (int): Number of segments, defaults to four per worker
+
+    Returns:
+        Tuple[int, int]: Sum of all multiplications and sum of enabled ones
+    """
+    size = os.path.getsize(file_path)
+    if size == 0:
+        return 0, 0
+
+    workers = workers or os.cpu_count() or 1
+    segments = min(segments or 4 * workers, size)
+    bounds = [size * i // segments for i in range(segments + 1)]
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        summaries = executor.map(
+            summarize_file_segment, repeat(file_path), bounds[:-1], bounds[1:]
+        )
+        summary = reduce(SegmentSummary.combine, summaries, EMPTY_SUMMARY)
+
+    # Memory starts enabled
+    return summary.total, summary.enabled_total
@@ -0,0 +1,62 @@
+"""
+Benchmarks for the Ceres Search counting engines.
+"""
+
+import random
+import time
+
+from counter import count_occurrences, count_occurrences_by_lines, count_x_mas_occurrences
+from vectorized_counter import (
+    count_occurrences_numpy,
+    count_x_mas_occurrences_numpy,
+    grid_to_array,
+    np,
+)
+
+
+def generate_grid(size, seed=2024):
+    """
+    Generates a square grid of random X, M, A and S letters.
+    """
+    rng = random.Random(seed)
+    return [[rng.choice("XMAS") for _ in range(size)] for _ in range(size)]
+
+
+def timed(function, *args):
+    """
+    Runs a function once and returns its result and duration in seconds.
+    """
+    start = time.perf_counter()
+    result = function(*args)
+    return result, time.perf_counter() - start
+
+
+def benchmark_grid(size):
+    """
+    Compares the pure-Python and NumPy engines on a generated grid.
+    """
+    grid = generate_grid(size)
+    array, convert = timed(grid_to_array, grid)
+    print(f"{size}x{size} grid (array conversion {convert * 1000:.1f} ms)")
+
+    words, python = timed(count_occurrences, grid, "XMAS")
+    by_lines = timed(count_occurrences_by_lines, grid, "XMAS")
+    vectorized = timed(count_occurrences_numpy, array, "XMAS")
+    assert words == by_lines[0] == vectorized[0]
+    print(f"  XMAS   python {python * 1000:9.1f} ms")
+    print(f"         lines  {by_lines[1] * 1000:9.1f} ms ({python / by_lines[1]:.0f}x)")
+    print(f"         numpy  {vectorized[1] * 1000:9.1f} ms ({python / vectorized[1]:.0f}x)")
+
+    x_mas, python = timed(count_x_mas_occurrences, grid)
+    vectorized = timed(count_x_mas_occurrences_numpy, array)
+    assert x_mas == vectorized[0]
+    print(f"  X-MAS  python {python * 1000:9.1f} ms")
+    print(f"         numpy  {vectorized[1] * 1000:9.1f} ms ({python / vectorized[1]:.0f}x)")
+
+
+if __name__ == "__main__":
+    if np is None:
+        print("NumPy is not installed, nothing to compare.")
+    else:
+        for grid_size in (140, 500, 1000):
+            benchmark_grid(grid_size)
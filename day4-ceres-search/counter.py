@@ -2,6 +2,11 @@
 Module for counting occurrences of words in a grid.
 """
 
+import re
+
+# Character separating the lines extracted from a grid, never part of a word
+LINE_SEPARATOR = "\n"
+
 
 def count_occurrences(grid, word):
     """
@@ -90,3 +95,56 @@ def check_x_mas_pattern(grid, row, col, diag1, diag2):
             return False
 
     return True
+
+
+def extract_lines(grid):
+    """
+    Extracts all rows, columns, diagonals and anti-diagonals of the grid.
+
+    The rows are joined into one string with a separator after each row.
+    In that string a step of one row is a stride of cols + 1, so every
+    column, diagonal and anti-diagonal is a strided slice. Wherever a
+    slice wraps around an edge it passes over a separator, so no word
+    can match across two lines.
+
+    Returns a list of four strings, one per line direction, each holding
+    all its lines separated by LINE_SEPARATOR.
+    """
+    rows = len(grid)
+    cols = len(grid[0]) if rows > 0 else 0
+    if cols == 0:
+        return ["", "", "", ""]
+
+    stride = cols + 1
+    flat = LINE_SEPARATOR.join("".join(row) for row in grid) + LINE_SEPARATOR
+
+    columns = LINE_SEPARATOR.join(flat[c::stride] for c in range(cols))
+    diagonals = LINE_SEPARATOR.join(flat[c::stride + 1] for c in range(stride + 1))
+    anti_diagonals = LINE_SEPARATOR.join(flat[c::stride - 1] for c in range(stride - 1))
+
+    return [flat, columns, diagonals, anti_diagonals]
+
+
+def count_in_text(text, word):
+    """
+    Counts the occurrences of the word in the text, overlapping ones included.
+    """
+    # str.count skips overlapping matches, which only exist for self-overlapping words
+    if not any(word[:i] == word[-i:] for i in range(1, len(word))):
+        return text.count(word)
+    return sum(1 for _ in re.finditer(f"(?={re.escape(word)})", text))
+
+
+def count_occurrences_by_lines(grid, word):
+    """
+    Counts all occurrences of the word in the grid in all 8 directions.
+
+    Same result as count_occurrences, but the grid is first cut into lines
+    so that the word and its reverse are searched with fast string scans.
+    """
+    if not word:
+        return len(grid) * (len(grid[0]) if grid else 0) * 8
+
+    lines = extract_lines(grid)
+    reverse = word[::-1]
+    return sum(count_in_text(text, word) + count_in_text(text, reverse) for text in lines)
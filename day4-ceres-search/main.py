@@ -2,7 +2,7 @@
 Main application for solving the Ceres Search challenge.
 """
 
-from counter import count_occurrences, count_x_mas_occurrences
+from counter import count_occurrences_by_lines, count_x_mas_occurrences
 
 
 def solve_challenge():
@@ -20,7 +20,7 @@ def solve_challenge():
         return
 
     # Part 1: Count occurrences of 'XMAS'
-    total_occurrences = count_occurrences(grid, "XMAS")
+    total_occurrences = count_occurrences_by_lines(grid, "XMAS")
     print(f"\nPart 1 Result:")
     print(f"The word 'XMAS' appears {total_occurrences} times in the word search.")
 
@@ -0,0 +1,92 @@
+"""
+Module for counting words and X-MAS patterns in huge grid files, tile by tile.
+"""
+
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+from counter import count_occurrences_by_lines, count_x_mas_occurrences
+from vectorized_counter import count_x_mas_occurrences_numpy, np
+
+# Number of grid rows owned by each tile
+DEFAULT_TILE_ROWS = 256
+
+
+def iter_tiles(lines, tile_rows, halo):
+    """
+    Groups grid rows into tiles followed by a halo of the next rows.
+
+    Yields (rows, tile_length) pairs, where the first tile_length rows
+    belong to the tile and the remaining ones are its halo.
+    """
+    window = []
+
+    for row in lines:
+        window.append(row)
+        if len(window) == tile_rows + halo:
+            yield window, tile_rows
+            # The halo rows start the next tile
+            window = window[tile_rows:]
+
+    while window:
+        yield window, min(tile_rows, len(window))
+        window = window[tile_rows:]
+
+
+def count_tile(rows, tile_length, word):
+    """
+    Counts the matches whose top row lies within the tile.
+
+    A match spans at most len(word) rows, so with a halo of len(word) - 1
+    rows below the tile, every match whose top row is in the tile is fully
+    visible. Matches entirely inside the halo belong to the next tile and
+    are subtracted. An X-MAS pattern spans three rows and needs a halo of
+    two rows.
+
+    Returns the number of word occurrences and of X-MAS patterns.
+    """
+    in_window = count_occurrences_by_lines(rows, word)
+    in_halo = count_occurrences_by_lines(rows[tile_length:], word)
+
+    # Rows past the tile never hold the top row of a three-row pattern
+    x_mas_rows = rows[: tile_length + 2]
+    if np is not None:
+        x_mas = count_x_mas_occurrences_numpy(x_mas_rows)
+    else:
+        x_mas = count_x_mas_occurrences(x_mas_rows)
+
+    return in_window - in_halo, x_mas
+
+
+def count_file_tiled(file_path, word="XMAS", tile_rows=DEFAULT_TILE_ROWS, workers=None):
+    """
+    Counts the word and the X-MAS pattern in a grid file using a pool of processes.
+
+    The file is read lazily in horizontal tiles, each sent to a worker
+    with its halo. At most two tiles per worker are in flight, so memory
+    stays bounded whatever the size of the grid. Totals are identical to
+    count_occurrences and count_x_mas_occurrences on the whole grid.
+
+    Returns the number of word occurrences and of X-MAS patterns.
+    """
+    workers = workers or os.cpu_count() or 1
+    halo = max(len(word) - 1, 2)
+    pending = deque()
+    total_words = total_x_mas = 0
+
+    with open(file_path, "r") as file, ProcessPoolExecutor(max_workers=workers) as executor:
+        lines = (line.strip() for line in file if line.strip())
+        for rows, tile_length in iter_tiles(lines, tile_rows, halo):
+            if len(pending) >= 2 * workers:
+                words, x_mas = pending.popleft().result()
+                total_words += words
+                total_x_mas += x_mas
+            pending.append(executor.submit(count_tile, rows, tile_length, word))
+
+        while pending:
+            words, x_mas = pending.popleft().result()
+            total_words += words
+            total_x_mas += x_mas
+
+    return total_words, total_x_mas
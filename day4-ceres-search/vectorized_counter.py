@@ -0,0 +1,78 @@
+"""
+Module for counting words and X-MAS patterns in a grid with NumPy.
+"""
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# Directions: N, NE, E, SE, S, SW, W, NW
+DIRECTIONS = [(-1, 0), (-1, 1), (0, 1), (1, 1), (1, 0), (1, -1), (0, -1), (-1, -1)]
+
+
+def grid_to_array(grid):
+    """
+    Converts a grid of characters into a 2-D array of byte codes.
+    """
+    if np is None:
+        raise ImportError("NumPy is required for the vectorized counter")
+    if isinstance(grid, np.ndarray):
+        return grid
+
+    rows = len(grid)
+    cols = len(grid[0]) if rows > 0 else 0
+    data = "".join("".join(row) for row in grid).encode("latin-1")
+    return np.frombuffer(data, dtype=np.uint8).reshape(rows, cols)
+
+
+def count_occurrences_numpy(grid, word):
+    """
+    Counts all occurrences of the word in the grid in all 8 directions.
+
+    For each direction, the grid is shifted once per letter of the word and
+    the shifted views are compared and combined into a boolean mask of the
+    cells where the word starts.
+    """
+    array = grid_to_array(grid)
+    rows, cols = array.shape
+    if not word:
+        return rows * cols * 8
+
+    codes = word.encode("latin-1")
+    reach = len(word) - 1
+    count = 0
+
+    for dr, dc in DIRECTIONS:
+        # Only cells where the whole word stays inside the grid can start it
+        top, bottom = max(0, -dr * reach), rows - max(0, dr * reach)
+        left, right = max(0, -dc * reach), cols - max(0, dc * reach)
+        if top >= bottom or left >= right:
+            continue
+
+        mask = array[top:bottom, left:right] == codes[0]
+        for i in range(1, len(codes)):
+            r, c = dr * i, dc * i
+            mask &= array[top + r : bottom + r, left + c : right + c] == codes[i]
+        count += int(mask.sum())
+
+    return count
+
+
+def count_x_mas_occurrences_numpy(grid):
+    """
+    Counts all occurrences of the X-MAS pattern in the grid.
+    """
+    array = grid_to_array(grid)
+    rows, cols = array.shape
+    if rows < 3 or cols < 3:
+        return 0
+
+    m, a, s = ord("M"), ord("A"), ord("S")
+    north_west, south_east = array[:-2, :-2], array[2:, 2:]
+    north_east, south_west = array[:-2, 2:], array[2:, :-2]
+
+    # Each diagonal must read MAS in one direction or the other
+    diag1 = (north_west == m) & (south_east == s) | (north_west == s) & (south_east == m)
+    diag2 = (north_east == m) & (south_west == s) | (north_east == s) & (south_west == m)
+    return int((diag1 & diag2 & (array[1:-1, 1:-1] == a)).sum())
@@ -0,0 +1,112 @@
+"""
+Module for answering many word-count queries over the same grid.
+"""
+
+from collections import deque
+
+from counter import LINE_SEPARATOR, extract_lines
+
+
+class AhoCorasick:
+    """
+    Aho-Corasick automaton counting many patterns in a single scan of a text.
+    """
+
+    def __init__(self, patterns):
+        """
+        Builds the automaton as a complete DFA over the characters of the patterns.
+        """
+        self.patterns = list(patterns)
+        self.transitions = [{}]
+        self.terminal = []
+
+        # Trie of all patterns
+        for pattern in self.patterns:
+            state = 0
+            for char in pattern:
+                if char not in self.transitions[state]:
+                    self.transitions.append({})
+                    self.transitions[state][char] = len(self.transitions) - 1
+                state = self.transitions[state][char]
+            self.terminal.append(state)
+
+        # Failure links in breadth-first order, completing the transitions of
+        # each state once the shallower states it falls back to are complete
+        alphabet = {char for pattern in self.patterns for char in pattern}
+        self.fail = [0] * len(self.transitions)
+        self.order = []
+        queue = deque([0])
+
+        while queue:
+            state = queue.popleft()
+            if state:
+                self.order.append(state)
+            for char, child in self.transitions[state].items():
+                self.fail[child] = self.transitions[self.fail[state]][char] if state else 0
+                queue.append(child)
+            fallback = self.transitions[self.fail[state]] if state else {}
+            for char in alphabet:
+                if char not in self.transitions[state]:
+                    self.transitions[state][char] = fallback.get(char, 0)
+
+    def count(self, text):
+        """
+        Counts the occurrences of every pattern in the text, overlapping ones included.
+
+        Visits of each state are tallied during the scan, then pushed down the
+        failure links, so the scan does no per-match work.
+        """
+        transitions = self.transitions
+        visits = [0] * len(transitions)
+        state = 0
+
+        for char in text:
+            state = transitions[state].get(char, 0)
+            visits[state] += 1
+
+        # A state also ends every pattern ending at its failure states
+        for state in reversed(self.order):
+            visits[self.fail[state]] += visits[state]
+
+        return {pattern: visits[state] for pattern, state in zip(self.patterns, self.terminal)}
+
+
+class WordGrid:
+    """
+    Index over a grid built once to count many words in all 8 directions.
+
+    The rows, columns, diagonals and anti-diagonals are extracted once into
+    a single text. A batch of words is then counted in one scan of that
+    text, whose cost grows with the grid size, not with the number of words.
+    """
+
+    def __init__(self, grid):
+        self.rows = len(grid)
+        self.cols = len(grid[0]) if self.rows > 0 else 0
+        self.text = LINE_SEPARATOR.join(extract_lines(grid))
+
+    def count_many(self, words):
+        """
+        Counts the occurrences of every word in the grid in all 8 directions.
+
+        Returns a dict mapping each word to the same count as count_occurrences.
+        """
+        words = set(words)
+        counts = {}
+        if "" in words:
+            words.discard("")
+            counts[""] = self.rows * self.cols * 8
+
+        # Reading a line backwards is the same as searching for the reversed word
+        patterns = words | {word[::-1] for word in words}
+        occurrences = AhoCorasick(sorted(patterns)).count(self.text)
+
+        for word in words:
+            counts[word] = occurrences[word] + occurrences[word[::-1]]
+        return counts
+
+    def count(self, word):
+        """
+        Counts the occurrences of a single word in the grid in all 8 directions.
+        """
+        return self.count_many([word])[word]
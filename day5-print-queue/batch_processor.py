@@ -0,0 +1,92 @@
+"""
+Module for validating and reordering large batches of updates in parallel.
+"""
+
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+
+from queue_checker import RuleIndex, get_middle_page
+
+# Number of updates sent to a worker at a time
+DEFAULT_CHUNK_SIZE = 5000
+
+# Rule index of the current worker process, set once by the pool initializer
+_worker_rule_index = None
+
+
+def init_worker(rule_index):
+    """
+    Stores the rule index in the worker process, so it is only pickled once per worker.
+    """
+    global _worker_rule_index
+    _worker_rule_index = rule_index
+
+
+def sum_middle_pages(rule_index, updates):
+    """
+    Sums the middle pages of the correctly-ordered and of the reordered updates.
+    """
+    total_middle_pages_part1 = 0
+    total_middle_pages_part2 = 0
+    for update in updates:
+        if rule_index.is_correct_order(update):
+            total_middle_pages_part1 += get_middle_page(update)
+        else:
+            total_middle_pages_part2 += rule_index.reordered_middle_page(update)
+    return total_middle_pages_part1, total_middle_pages_part2
+
+
+def process_chunk(updates):
+    """
+    Processes a chunk of updates in a worker with the rule index it received at startup.
+    """
+    return sum_middle_pages(_worker_rule_index, updates)
+
+
+def iter_chunks(updates, chunk_size):
+    """
+    Splits any iterable of updates into lists of at most chunk_size updates.
+    """
+    iterator = iter(updates)
+    while True:
+        chunk = list(islice(iterator, chunk_size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def process_updates(updates, rules, workers=None, chunk_size=DEFAULT_CHUNK_SIZE):
+    """
+    Validates and reorders a batch of updates using a pool of processes.
+
+    The rule index is sent to each worker once through the pool initializer,
+    and the updates are streamed in chunks with at most two chunks per worker
+    in flight, so the rules are never pickled along with the updates.
+
+    Returns the sum of middle pages of the correctly-ordered updates and the
+    sum of middle pages of the reordered incorrect updates.
+    """
+    rule_index = rules if isinstance(rules, RuleIndex) else RuleIndex(rules)
+    workers = workers or os.cpu_count() or 1
+    pending = deque()
+    total_middle_pages_part1 = 0
+    total_middle_pages_part2 = 0
+
+    with ProcessPoolExecutor(
+        max_workers=workers, initializer=init_worker, initargs=(rule_index,)
+    ) as executor:
+        for chunk in iter_chunks(updates, chunk_size):
+            if len(pending) >= 2 * workers:
+                part1, part2 = pending.popleft().result()
+                total_middle_pages_part1 += part1
+                total_middle_pages_part2 += part2
+            pending.append(executor.submit(process_chunk, chunk))
+
+        while pending:
+            part1, part2 = pending.popleft().result()
+            total_middle_pages_part1 += part1
+            total_middle_pages_part2 += part2
+
+    return total_middle_pages_part1, total_middle_pages_part2
@@ -2,7 +2,7 @@
 Main application for solving the Print Queue challenge.
 """
 
-from queue_checker import parse_input, is_correct_order, get_middle_page, reorder_update
+from queue_checker import parse_input, get_middle_page, RuleIndex
 
 
 def solve_challenge():
@@ -21,18 +21,18 @@ def solve_challenge():
 
     # Parse ordering rules and updates
     ordering_rules, updates = parse_input(content)
+    rule_index = RuleIndex(ordering_rules)
 
     # Process updates
     total_middle_pages_part1 = 0
     total_middle_pages_part2 = 0
     for update in updates:
-        if is_correct_order(update, ordering_rules):
+        if rule_index.is_correct_order(update):
             middle_page = get_middle_page(update)
             total_middle_pages_part1 += middle_page
         else:
-            # Reorder the update
-            reordered_update = reorder_update(update, ordering_rules)
-            middle_page = get_middle_page(reordered_update)
+            # Only the middle page of the reordered update is needed
+            middle_page = rule_index.reordered_middle_page(update)
             total_middle_pages_part2 += middle_page
 
     print(f"\nPart 1 Result:")
@@ -2,6 +2,9 @@
 Module for checking update orderings and processing input.
 """
 
+from collections import deque
+from functools import cmp_to_key
+
 
 def parse_input(content):
     """
@@ -89,3 +92,171 @@ def reorder_update(update, ordering_rules):
         raise ValueError("Cycle detected, cannot reorder update")
 
     return ordered
+
+
+def select(items, k, key):
+    """
+    Returns the item that would be at index k once the items are sorted by key.
+    """
+    while True:
+        pivot = key(items[len(items) // 2])
+        lower = [item for item in items if key(item) < pivot]
+        if k < len(lower):
+            items = lower
+            continue
+        equal = [item for item in items if key(item) == pivot]
+        if k < len(lower) + len(equal):
+            return equal[k - len(lower)]
+        k -= len(lower) + len(equal)
+        items = [item for item in items if key(item) > pivot]
+
+
+class RuleIndex:
+    """
+    Ordering rules indexed by page, built once and shared by every update.
+    """
+
+    def __init__(self, ordering_rules):
+        # Pages that must come after each page
+        self.successors = {}
+        for x, y in ordering_rules:
+            self.successors.setdefault(x, set()).add(y)
+        self.rank = self.compute_rank()
+
+    def compute_rank(self):
+        """
+        Returns the position of each page in a topological order of all the rules,
+        or None when the rules contain a cycle.
+        """
+        in_degree = {}
+        for page, later_pages in self.successors.items():
+            in_degree.setdefault(page, 0)
+            for later_page in later_pages:
+                in_degree[later_page] = in_degree.get(later_page, 0) + 1
+
+        queue = deque(page for page, degree in in_degree.items() if degree == 0)
+        rank = {}
+
+        while queue:
+            page = queue.popleft()
+            rank[page] = len(rank)
+            for later_page in self.successors.get(page, ()):
+                in_degree[later_page] -= 1
+                if in_degree[later_page] == 0:
+                    queue.append(later_page)
+
+        return rank if len(rank) == len(in_degree) else None
+
+    def rank_of(self, page):
+        """
+        Returns the global rank of a page, pages without rules come first.
+        """
+        return self.rank.get(page, -1)
+
+    def compare(self, x, y):
+        """
+        Compares two pages according to the rule between them, if any.
+        """
+        if y in self.successors.get(x, ()):
+            return -1
+        if x in self.successors.get(y, ()):
+            return 1
+        return 0
+
+    def is_correct_order(self, update):
+        """
+        Checks if the update is in the correct order according to the applicable ordering rules.
+
+        Each page is only compared with the pages before it, so the check
+        costs O(k^2) set lookups for an update of k pages, whatever the
+        number of rules.
+        """
+        successors = self.successors
+        for i in range(1, len(update)):
+            later_pages = successors.get(update[i])
+            if later_pages:
+                for j in range(i):
+                    if update[j] in later_pages:
+                        return False
+        return True
+
+    def reorder_update(self, update):
+        """
+        Reorders the update according to the applicable ordering rules.
+
+        When the rules are acyclic, this is a plain sort by global rank.
+        Otherwise the pages are sorted with the pairwise rules, which is
+        enough whenever every pair of pages in the update has a rule, and
+        Kahn's algorithm is the last resort.
+        """
+        if self.rank is not None:
+            return sorted(update, key=self.rank_of)
+
+        ordered = sorted(update, key=cmp_to_key(self.compare))
+        if self.is_correct_order(ordered):
+            return ordered
+        return self.reorder_update_kahn(update)
+
+    def reordered_middle_page(self, update):
+        """
+        Returns the middle page of the reordered update without fully sorting it.
+        """
+        middle = len(update) // 2
+        if self.rank is not None:
+            return select(list(update), middle, self.rank_of)
+
+        # With exactly one rule for every pair, the rules form an acyclic total
+        # order exactly when the predecessor counts are 0..k-1, and the middle
+        # page is the one with `middle` predecessors
+        predecessors = {page: 0 for page in update}
+        pairs = 0
+        for page in update:
+            for later_page in self.successors.get(page, ()):
+                if later_page in predecessors:
+                    if page in self.successors.get(later_page, ()):
+                        # Opposite rules on one pair
+                        pairs = -1
+                        break
+                    predecessors[later_page] += 1
+                    pairs += 1
+            if pairs < 0:
+                break
+        k = len(update)
+        if (
+            len(predecessors) == k
+            and pairs == k * (k - 1) // 2
+            and sorted(predecessors.values()) == list(range(k))
+        ):
+            for page, count in predecessors.items():
+                if count == middle:
+                    return page
+
+        return get_middle_page(self.reorder_update(update))
+
+    def reorder_update_kahn(self, update):
+        """
+        Reorders the update with Kahn's algorithm over the applicable ordering rules.
+        """
+        pages = set(update)
+        graph = {page: self.successors.get(page, set()) & pages for page in update}
+        in_degree = {page: 0 for page in update}
+        for neighbors in graph.values():
+            for neighbor in neighbors:
+                in_degree[neighbor] += 1
+
+        # Kahn's algorithm for topological sort
+        queue = deque([page for page in update if in_degree[page] == 0])
+        ordered = []
+
+        while queue:
+            page = queue.popleft()
+            ordered.append(page)
+            for neighbor in graph[page]:
+                in_degree[neighbor] -= 1
+                if in_degree[neighbor] == 0:
+                    queue.append(neighbor)
+
+        if len(ordered) != len(update):
+            raise ValueError("Cycle detected, cannot reorder update")
+
+        return ordered
@@ -0,0 +1,193 @@
+"""
+Module for maintaining ordering rules that change over time.
+"""
+
+from queue_checker import RuleIndex, get_middle_page
+
+
+class RuleStore(RuleIndex):
+    """
+    Mutable rule index with a verdict cache over a set of tracked updates.
+
+    The global rank is kept valid across rule additions with the
+    Pearce-Kelly algorithm, which only reorders the pages between the two
+    ends of a new rule. The verdict of an update depends only on the rules
+    between its own pages, so a change to the rule x|y invalidates the
+    cached verdicts of the updates containing both x and y, and nothing else.
+    """
+
+    def __init__(self, ordering_rules=()):
+        super().__init__(ordering_rules)
+        # Pages that must come before each page
+        self.predecessors = {}
+        for x, later_pages in self.successors.items():
+            for y in later_pages:
+                self.predecessors.setdefault(y, set()).add(x)
+        self.next_rank = len(self.rank) if self.rank is not None else 0
+
+        # Tracked updates as tuples, with the number of copies of each
+        self.updates = {}
+        self.updates_by_page = {}
+        # Correctness and middle page of each up-to-date update
+        self.verdicts = {}
+        self.stale = set()
+        self.total_middle_pages_part1 = 0
+        self.total_middle_pages_part2 = 0
+
+    def add_rule(self, x, y):
+        """
+        Adds the rule x|y, page x must come before page y.
+        """
+        if y in self.successors.get(x, ()):
+            return
+        self.successors.setdefault(x, set()).add(y)
+        self.predecessors.setdefault(y, set()).add(x)
+        self.invalidate(x, y)
+
+        if self.rank is not None:
+            for page in (x, y):
+                if page not in self.rank:
+                    self.rank[page] = self.next_rank
+                    self.next_rank += 1
+            self.update_rank(x, y)
+
+    def remove_rule(self, x, y):
+        """
+        Removes the rule x|y if present.
+        """
+        if y not in self.successors.get(x, ()):
+            return
+        self.successors[x].discard(y)
+        self.predecessors[y].discard(x)
+        self.invalidate(x, y)
+
+        # Removing a rule keeps a topological order valid, but may break a cycle
+        if self.rank is None:
+            self.rank = self.compute_rank()
+            self.next_rank = len(self.rank) if self.rank is not None else 0
+
+    def update_rank(self, x, y):
+        """
+        Restores a topological order after adding the rule x|y (Pearce-Kelly).
+
+        Only the pages ranked between y and x are visited: those reachable
+        from y and those reaching x are moved so the former all come after
+        the latter, reusing their current ranks. The rank becomes None when
+        the new rule closes a cycle.
+        """
+        lower, upper = self.rank[y], self.rank[x]
+        if lower > upper:
+            return
+
+        # Pages reachable from y that are ranked no later than x
+        forward = self.search(y, self.successors, lambda rank: rank <= upper)
+        if x in forward:
+            self.rank = None
+            return
+        # Pages reaching x that are ranked no earlier than y
+        backward = self.search(x, self.predecessors, lambda rank: rank >= lower)
+
+        backward.sort(key=self.rank.get)
+        forward.sort(key=self.rank.get)
+        ranks = sorted(self.rank[page] for page in backward + forward)
+        for page, rank in zip(backward + forward, ranks):
+            self.rank[page] = rank
+
+    def search(self, start, graph, in_range):
+        """
+        Returns the pages reachable from start through pages whose rank is in range.
+        """
+        seen = {start}
+        stack = [start]
+        while stack:
+            page = stack.pop()
+            for neighbor in graph.get(page, ()):
+                if neighbor not in seen and in_range(self.rank[neighbor]):
+                    seen.add(neighbor)
+                    stack.append(neighbor)
+        return list(seen)
+
+    def add_update(self, update):
+        """
+        Tracks an update, its verdict is computed on the next revalidation.
+        """
+        key = tuple(update)
+        copies = self.updates.get(key, 0)
+        if copies == 0:
+            for page in key:
+                self.updates_by_page.setdefault(page, set()).add(key)
+            self.stale.add(key)
+        elif key not in self.stale:
+            self.tally(key, 1)
+        self.updates[key] = copies + 1
+
+    def remove_update(self, update):
+        """
+        Stops tracking one copy of an update.
+        """
+        key = tuple(update)
+        copies = self.updates[key]
+        if key not in self.stale:
+            self.tally(key, -1)
+        if copies > 1:
+            self.updates[key] = copies - 1
+            return
+
+        del self.updates[key]
+        self.verdicts.pop(key, None)
+        self.stale.discard(key)
+        for page in key:
+            self.updates_by_page[page].discard(key)
+
+    def invalidate(self, x, y):
+        """
+        Marks as stale the tracked updates containing both pages of the rule x|y.
+        """
+        with_x = self.updates_by_page.get(x, set())
+        with_y = self.updates_by_page.get(y, set())
+        for key in with_x & with_y:
+            if key not in self.stale:
+                self.tally(key, -self.updates[key])
+                del self.verdicts[key]
+                self.stale.add(key)
+
+    def tally(self, key, copies):
+        """
+        Adds the middle page of an up-to-date update to the totals, copies times.
+        """
+        correct, middle_page = self.verdicts[key]
+        if correct:
+            self.total_middle_pages_part1 += copies * middle_page
+        else:
+            self.total_middle_pages_part2 += copies * middle_page
+
+    def revalidate(self):
+        """
+        Computes the verdicts of the stale updates only.
+
+        All verdicts are computed before any is recorded, so when an update
+        cannot be reordered the ValueError leaves the store unchanged.
+
+        Returns the number of updates that were re-validated.
+        """
+        verdicts = {}
+        for key in self.stale:
+            if self.is_correct_order(key):
+                verdicts[key] = (True, get_middle_page(key))
+            else:
+                verdicts[key] = (False, self.reordered_middle_page(key))
+
+        self.verdicts.update(verdicts)
+        for key in verdicts:
+            self.tally(key, self.updates[key])
+
+        self.stale.clear()
+        return len(verdicts)
+
+    def totals(self):
+        """
+        Returns the sums of middle pages of the correctly-ordered updates and of
+        the reordered incorrect updates, re-validating only the stale ones.
+        """
+        self.revalidate()
+        return self.total_middle_pages_part1, self.total_middle_pages_part2
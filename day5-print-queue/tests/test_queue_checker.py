@@ -0,0 +1,123 @@
+"""
+Test cases for queue checker module.
+python -m unittest discover -s tests -v
+"""
+import random
+import unittest
+from queue_checker import (
+    RuleIndex,
+    get_middle_page,
+    is_correct_order,
+    parse_input,
+    reorder_update,
+)
+
+EXAMPLE = """
+47|53
+97|13
+97|61
+97|47
+75|29
+61|13
+75|53
+29|13
+97|29
+53|29
+61|53
+97|53
+61|29
+47|13
+75|47
+97|75
+47|61
+75|61
+47|29
+75|13
+53|13
+
+75,47,61,53,29
+97,61,53,29,13
+75,29,13
+75,97,47,61,53
+61,13,29
+97,13,75,29,47
+"""
+
+
+class TestRuleIndex(unittest.TestCase):
+    """Test cases for the indexed ordering rules."""
+
+    def setUp(self):
+        """Parse the example from problem description."""
+        self.ordering_rules, self.updates = parse_input(EXAMPLE)
+        self.rule_index = RuleIndex(self.ordering_rules)
+
+    def test_example(self):
+        """Test both parts with example from problem description."""
+        part1 = sum(
+            get_middle_page(update)
+            for update in self.updates
+            if self.rule_index.is_correct_order(update)
+        )
+        part2 = sum(
+            self.rule_index.reordered_middle_page(update)
+            for update in self.updates
+            if not self.rule_index.is_correct_order(update)
+        )
+        self.assertEqual(part1, 143)
+        self.assertEqual(part2, 123)
+
+    def test_reorder_update(self):
+        """Test reordering matches the original topological sort."""
+        for update in self.updates:
+            with self.subTest(update=update):
+                self.assertEqual(
+                    self.rule_index.is_correct_order(update),
+                    is_correct_order(update, self.ordering_rules),
+                )
+                self.assertEqual(
+                    self.rule_index.reorder_update(update),
+                    reorder_update(update, self.ordering_rules),
+                )
+
+    def test_cyclic_rules(self):
+        """Test total orders inside an update when the global rules are cyclic."""
+        rules = [(1, 2), (2, 3), (1, 3), (3, 4), (4, 1)]
+        rule_index = RuleIndex(rules)
+        self.assertIsNone(rule_index.rank)
+        self.assertEqual(rule_index.reorder_update([3, 1, 2]), [1, 2, 3])
+        self.assertEqual(rule_index.reordered_middle_page([3, 1, 2]), 2)
+
+    def test_opposite_rules_on_one_pair(self):
+        """Test opposite rules on a pair do not make up for a pair without rule."""
+        for rules in ([(1, 2), (2, 1), (1, 3)], [(1, 3), (2, 3), (3, 2)]):
+            rule_index = RuleIndex(rules)
+            with self.subTest(rules=rules):
+                with self.assertRaises(ValueError):
+                    reorder_update([1, 2, 3], rules)
+                with self.assertRaises(ValueError):
+                    rule_index.reordered_middle_page([1, 2, 3])
+
+    def test_random_total_orders(self):
+        """Test random rules against the original functions."""
+        rng = random.Random(2024)
+        pages = list(range(10, 20))
+        for _ in range(300):
+            rng.shuffle(pages)
+            rules = [
+                (x, y) if rng.random() < 0.9 else (y, x)
+                for i, x in enumerate(pages)
+                for y in pages[i + 1 :]
+            ]
+            rule_index = RuleIndex(rules)
+            update = rng.sample(pages, rng.choice([3, 5, 7]))
+            try:
+                expected = get_middle_page(reorder_update(update, rules))
+            except ValueError:
+                with self.assertRaises(ValueError):
+                    rule_index.reordered_middle_page(update)
+                continue
+            self.assertEqual(
+                rule_index.is_correct_order(update), is_correct_order(update, rules)
+            )
+            self.assertEqual(rule_index.reordered_middle_page(update), expected)
@@ -0,0 +1,111 @@
+"""
+Test cases for rule store module.
+python -m unittest discover -s tests -v
+"""
+import random
+import unittest
+from batch_processor import sum_middle_pages
+from queue_checker import RuleIndex, parse_input
+from rule_store import RuleStore
+from tests.test_queue_checker import EXAMPLE
+
+
+class TestRuleStore(unittest.TestCase):
+    """Test cases for the mutable rule store."""
+
+    def setUp(self):
+        """Track the updates of the example from problem description."""
+        self.ordering_rules, self.updates = parse_input(EXAMPLE)
+        self.store = RuleStore(self.ordering_rules)
+        for update in self.updates:
+            self.store.add_update(update)
+
+    def assert_rank_is_topological(self, store):
+        """Check every rule goes from a lower to a higher rank."""
+        for x, later_pages in store.successors.items():
+            for y in later_pages:
+                self.assertLess(store.rank[x], store.rank[y])
+
+    def test_example(self):
+        """Test both parts with example from problem description."""
+        self.assertEqual(self.store.totals(), (143, 123))
+        self.assertEqual(self.store.revalidate(), 0)
+
+    def test_rule_change_revalidates_affected_updates(self):
+        """Test a rule change only re-validates the updates holding both pages."""
+        self.store.totals()
+        self.store.remove_rule(29, 13)
+        affected = [update for update in self.updates if 29 in update and 13 in update]
+        self.assertEqual(self.store.revalidate(), len(affected))
+
+        self.store.add_rule(29, 13)
+        self.assertEqual(self.store.totals(), (143, 123))
+        self.assertEqual(self.store.revalidate(), 0)
+
+    def test_update_copies(self):
+        """Test tracking and untracking copies of the same update."""
+        self.store.totals()
+        self.store.add_update([75, 47, 61, 53, 29])
+        self.assertEqual(self.store.totals(), (143 + 61, 123))
+        self.store.remove_update([75, 47, 61, 53, 29])
+        self.store.remove_update([75, 47, 61, 53, 29])
+        self.assertEqual(self.store.totals(), (143 - 61, 123))
+
+    def test_cycle_and_recovery(self):
+        """Test the rank is dropped on a cycle and restored once it is broken."""
+        store = RuleStore([(1, 2), (2, 3)])
+        store.add_rule(3, 1)
+        self.assertIsNone(store.rank)
+        store.remove_rule(3, 1)
+        self.assertIsNotNone(store.rank)
+        self.assert_rank_is_topological(store)
+
+    def test_failed_revalidation_leaves_totals_intact(self):
+        """Test an update that cannot be reordered does not corrupt the totals."""
+        store = RuleStore([(1, 2), (2, 1)])
+        store.add_update([5, 6, 7])
+        store.add_update([1, 2])
+        with self.assertRaises(ValueError):
+            store.totals()
+        with self.assertRaises(ValueError):
+            store.totals()
+
+        store.remove_rule(2, 1)
+        self.assertEqual(store.totals(), (8, 0))
+
+    def test_random_changes(self):
+        """Test random rule and update changes against a full recomputation."""
+        rng = random.Random(2024)
+        pages = list(range(12))
+        rng.shuffle(pages)
+        all_rules = [(x, y) for i, x in enumerate(pages) for y in pages[i + 1 :]]
+        rules = set(rng.sample(all_rules, len(all_rules) // 2))
+        updates = [rng.sample(pages, rng.choice([1, 3, 5])) for _ in range(40)]
+        store = RuleStore(sorted(rules))
+        for update in updates:
+            store.add_update(update)
+
+        for _ in range(300):
+            operation = rng.random()
+            if operation < 0.4:
+                rule = rng.choice(all_rules)
+                store.add_rule(*rule)
+                rules.add(rule)
+            elif operation < 0.7 and rules:
+                rule = rng.choice(sorted(rules))
+                store.remove_rule(*rule)
+                rules.discard(rule)
+            elif operation < 0.85:
+                update = rng.sample(pages, 3)
+                store.add_update(update)
+                updates.append(update)
+            else:
+                store.remove_update(updates.pop(rng.randrange(len(updates))))
+
+            self.assert_rank_is_topological(store)
+            expected = sum_middle_pages(RuleIndex(sorted(rules)), updates)
+            total_part1, total_part2 = store.totals()
+            self.assertEqual(total_part1, expected[0])
+            if len(rules) == len(all_rules):
+                # The reordered middle pages are only unique for a total order
+                self.assertEqual(total_part2, expected[1])
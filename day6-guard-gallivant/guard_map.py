@@ -0,0 +1,252 @@
+# guard_map.py
+
+"""
+Module for simulating the guard with precomputed jumps between obstacles.
+"""
+
+from array import array
+
+# Facings in turning order, each turn to the right moves to the next one
+FACINGS = "^>v<"
+
+
+class GuardMap:
+    """
+    Grid indexed once so the guard moves a whole segment at a time.
+
+    Cells are numbered row by row. For each facing and each cell, the jump
+    table holds the cell where the guard stops in front of the next obstacle,
+    or -1 when it walks off the map, so a patrol costs one lookup per turn
+    instead of one step per cell.
+    """
+
+    def __init__(self, grid):
+        self.rows = len(grid)
+        self.cols = len(grid[0]) if self.rows > 0 else 0
+        self.obstacles = bytearray(self.rows * self.cols)
+        self.empty = bytearray(self.rows * self.cols)
+        self.start = -1
+        self.start_facing = 0
+
+        # Find the obstacles and the guard's starting position, once
+        for r in range(self.rows):
+            for c in range(self.cols):
+                if grid[r][c] == "#":
+                    self.obstacles[r * self.cols + c] = 1
+                elif grid[r][c] == ".":
+                    self.empty[r * self.cols + c] = 1
+                elif self.start < 0 and grid[r][c] in FACINGS:
+                    self.start = r * self.cols + c
+                    self.start_facing = FACINGS.index(grid[r][c])
+
+        # Cell offset of one step for each facing: N, E, S, W
+        self.steps = (-self.cols, 1, self.cols, -1)
+        self.jumps = [self.build_jumps(facing) for facing in range(4)]
+
+        # Turn points of the loop checks, reused and cleared after each one
+        self.turns = bytearray(self.rows * self.cols * 4)
+
+    def build_jumps(self, facing):
+        """
+        Returns the stop cell of every cell when walking with the given facing.
+
+        Each line is scanned from the side the guard walks towards, carrying
+        the cell just before the last obstacle seen.
+        """
+        rows, cols = self.rows, self.cols
+        jumps = array("q", [-1]) * (rows * cols)
+        step = self.steps[facing]
+
+        if facing in (0, 2):
+            lines = [range(c, rows * cols, cols) for c in range(cols)]
+        else:
+            lines = [range(r * cols, (r + 1) * cols) for r in range(rows)]
+
+        for line in lines:
+            # Walking north or west, the guard goes towards the start of the line
+            cells = line if facing in (0, 3) else reversed(line)
+            stop = -1
+            for cell in cells:
+                if self.obstacles[cell]:
+                    stop = cell - step
+                else:
+                    jumps[cell] = stop
+
+        return jumps
+
+    def cell(self, row, col):
+        """
+        Returns the cell number of a (row, col) position.
+        """
+        return row * self.cols + col
+
+    def position(self, cell):
+        """
+        Returns the (row, col) position of a cell.
+        """
+        return divmod(cell, self.cols)
+
+    def next_stop(self, cell, facing, obstruction=-1):
+        """
+        Returns where the guard stops walking from a cell, or -1 if it leaves the map.
+
+        The optional obstruction cell is an extra obstacle that is not in
+        the grid, it only stops the guard when it lies between the cell and
+        the next real obstacle.
+        """
+        stop = self.jumps[facing][cell]
+        if obstruction < 0:
+            return stop
+
+        cols = self.cols
+        if facing in (0, 2):
+            # Same column, and ahead of the guard before the stop cell
+            if obstruction % cols != cell % cols:
+                return stop
+        elif obstruction // cols != cell // cols:
+            return stop
+
+        step = self.steps[facing]
+        distance = (obstruction - cell) // step
+        if distance <= 0:
+            return stop
+        if stop >= 0 and distance > (stop - cell) // step:
+            return stop
+        return obstruction - step
+
+    def does_loop(self, obstruction=-1, state=None):
+        """
+        Checks if the guard gets stuck in a loop.
+
+        Only the turn points are recorded, in a flat bytearray indexed by
+        cell * 4 + facing: the guard loops exactly when it turns twice at
+        the same cell with the same facing. The bytearray is shared by all
+        checks, only the recorded turn points are cleared afterwards.
+
+        Args:
+            obstruction: Optional cell of an extra obstacle.
+            state: Optional (cell, facing) to start from instead of the guard's start.
+
+        Returns:
+            True if the guard never leaves the map.
+        """
+        cell, facing = state if state is not None else (self.start, self.start_facing)
+        if cell < 0:
+            return False  # Guard's starting position not found
+
+        turns = self.turns
+        recorded = []
+        next_stop = self.next_stop
+
+        while True:
+            cell = next_stop(cell, facing, obstruction)
+            if cell < 0:
+                # Guard moves off the map
+                loops = False
+                break
+            state = cell * 4 + facing
+            if turns[state]:
+                # Loop detected
+                loops = True
+                break
+            turns[state] = 1
+            recorded.append(state)
+            facing = (facing + 1) % 4
+
+        for state in recorded:
+            turns[state] = 0
+        return loops
+
+    def patrol(self):
+        """
+        Walks the guard's patrol and records how each cell is first entered.
+
+        Returns:
+            A dict mapping each cell entered by the guard, in order of first
+            entry, to the (cell, facing) state just before entering it, and
+            whether the patrol loops.
+        """
+        entries = {}
+        cell, facing = self.start, self.start_facing
+        if cell < 0:
+            return entries, False  # Guard's starting position not found
+
+        turns = bytearray(self.rows * self.cols * 4)
+
+        while True:
+            stop = self.jumps[facing][cell]
+            step = self.steps[facing]
+            end = stop if stop >= 0 else self.edge_cell(cell, facing)
+            for walked in range(cell + step, end + step, step):
+                if walked not in entries:
+                    entries[walked] = (walked - step, facing)
+
+            if stop < 0:
+                # Guard moves off the map
+                return entries, False
+            state = stop * 4 + facing
+            if turns[state]:
+                # Loop detected
+                return entries, True
+            turns[state] = 1
+            cell, facing = stop, (facing + 1) % 4
+
+    def visited(self):
+        """
+        Returns the set of (row, col) positions visited by the guard.
+        """
+        if self.start < 0:
+            return set()  # Guard's starting position not found
+
+        entries, _ = self.patrol()
+        visited = {self.position(cell) for cell in entries}
+        visited.add(self.position(self.start))
+        return visited
+
+    def find_obstruction_positions(self):
+        """
+        Finds all positions where adding an obstruction causes the guard to loop.
+
+        An obstruction off the patrol path cannot change the patrol, so only
+        the cells on the path are tried. Each trial resumes from the state
+        just before the guard first enters the cell, since the patrol up to
+        that point is unchanged, and the obstruction is only virtual.
+
+        Returns:
+            The (row, col) positions in row-major order, as find_obstruction_positions.
+        """
+        entries, loops = self.patrol()
+        positions = [
+            cell
+            for cell, state in entries.items()
+            if cell != self.start and self.empty[cell] and self.does_loop(cell, state)
+        ]
+
+        if loops:
+            # The patrol already loops whatever obstruction is added off its path
+            positions.extend(self.unreached_cells(entries))
+
+        return [self.position(cell) for cell in sorted(positions)]
+
+    def unreached_cells(self, entries):
+        """
+        Returns the empty cells, other than the start, that the patrol never enters.
+        """
+        return [
+            cell
+            for cell in range(self.rows * self.cols)
+            if self.empty[cell] and cell != self.start and cell not in entries
+        ]
+
+    def edge_cell(self, cell, facing):
+        """
+        Returns the last cell on the map when walking from a cell with the given facing.
+        """
+        row, col = self.position(cell)
+        if facing == 0:
+            return col
+        if facing == 1:
+            return row * self.cols + self.cols - 1
+        if facing == 2:
+            return (self.rows - 1) * self.cols + col
+        return row * self.cols
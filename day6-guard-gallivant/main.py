@@ -4,7 +4,7 @@
 Main application for solving the Guard Gallivant challenge.
 """
 
-from guard_simulator import simulate_guard, find_obstruction_positions
+from guard_map import GuardMap
 
 
 def solve_challenge():
@@ -22,7 +22,8 @@ def solve_challenge():
         return
 
     # Part 1: Simulate guard movement
-    visited_positions = simulate_guard(grid)
+    guard_map = GuardMap(grid)
+    visited_positions = guard_map.visited()
     total_visited = len(visited_positions)
     print(f"\nPart 1 Result:")
     print(
@@ -30,7 +31,7 @@ def solve_challenge():
     )
 
     # Part 2: Find obstruction positions
-    obstruction_positions = find_obstruction_positions(grid)
+    obstruction_positions = guard_map.find_obstruction_positions()
     total_obstructions = len(obstruction_positions)
     print(f"\nPart 2 Result:")
     print(f"There are {total_obstructions} possible obstruction positions.")
@@ -0,0 +1,88 @@
+# parallel_search.py
+
+"""
+Module for finding obstruction positions with a pool of processes.
+"""
+
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+from guard_map import GuardMap
+
+# Number of candidate cells sent to a worker at a time
+DEFAULT_BATCH_SIZE = 256
+
+# Guard map of the current worker process, built once by the pool initializer
+_worker_guard_map = None
+
+
+def encode_grid(grid):
+    """
+    Encodes the grid as compact bytes, one line per row.
+    """
+    return "\n".join("".join(row) for row in grid).encode("latin-1")
+
+
+def init_worker(data):
+    """
+    Builds the guard map in the worker process from the encoded grid.
+    """
+    global _worker_guard_map
+    _worker_guard_map = GuardMap(data.decode("latin-1").split("\n"))
+
+
+def find_looping_cells(candidates):
+    """
+    Returns the candidate cells where a virtual obstacle makes the guard loop.
+
+    Each candidate is a (cell, previous cell, facing) triple, the trial
+    resumes from the state just before the guard first enters the cell.
+    """
+    return [
+        cell
+        for cell, previous, facing in candidates
+        if _worker_guard_map.does_loop(cell, (previous, facing))
+    ]
+
+
+def find_obstruction_positions_parallel(grid, workers=None, batch_size=DEFAULT_BATCH_SIZE):
+    """
+    Finds all positions where adding an obstruction causes the guard to loop.
+
+    The grid is sent to each worker once, through the pool initializer, and
+    the candidate cells of the patrol path are streamed in batches, at most
+    two batches per worker in flight.
+
+    Returns:
+        The (row, col) positions in row-major order, as find_obstruction_positions.
+    """
+    guard_map = GuardMap(grid)
+    entries, loops = guard_map.patrol()
+    candidates = [
+        (cell, previous, facing)
+        for cell, (previous, facing) in entries.items()
+        if cell != guard_map.start and guard_map.empty[cell]
+    ]
+
+    workers = workers or os.cpu_count() or 1
+    pending = deque()
+    positions = []
+
+    with ProcessPoolExecutor(
+        max_workers=workers, initializer=init_worker, initargs=(encode_grid(grid),)
+    ) as executor:
+        for i in range(0, len(candidates), batch_size):
+            if len(pending) >= 2 * workers:
+                positions.extend(pending.popleft().result())
+            batch = candidates[i : i + batch_size]
+            pending.append(executor.submit(find_looping_cells, batch))
+
+        while pending:
+            positions.extend(pending.popleft().result())
+
+    if loops:
+        # The patrol already loops whatever obstruction is added off its path
+        positions.extend(guard_map.unreached_cells(entries))
+
+    return [guard_map.position(cell) for cell in sorted(positions)]